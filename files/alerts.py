@@ -6,13 +6,39 @@ medication reminders, and health anomaly detection.
 """
 
 import json
+import time
 import logging
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 log = logging.getLogger("Alerts")
 
+# orjson is much faster for the JSONL log; fall back to stdlib json.
+# Both produce/accept bytes so the log file is handled in binary mode.
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+    _loads = json.loads
+
+
+async def _in_thread(fn, *args):
+    """
+    asyncio.to_thread() that, if cancelled, still waits for the thread
+    to return before re-raising — the file call can't be interrupted,
+    so the caller must not close the file under it.
+    """
+    fut = asyncio.ensure_future(asyncio.to_thread(fn, *args))
+    try:
+        return await asyncio.shield(fut)
+    except asyncio.CancelledError:
+        await asyncio.wait([fut])
+        raise
+
 
 class AlertSystem:
     """Handles all alert types with cooldown, logging, and notification."""
@@ -22,9 +48,25 @@ class AlertSystem:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
-        self._cooldowns = {}
+        self._cooldowns = {}    # alert_type -> time.monotonic() of last trigger
+        self._cooldown = config.get("fall_cooldown_seconds", 30)
         self.last_motion = datetime.now()
 
+        # Background JSONL writer (started lazily on first alert)
+        self._log_queue = None
+        self._log_task = None
+        self._log_file = None
+
+        # Periodic checks, all driven by run_scheduler():
+        # [next_deadline (time.monotonic()), interval, async fn]
+        self._periodics = []
+        self._med_schedule = self._parse_medication_schedule()
+        self._med_last = datetime.now()
+
+        self.add_periodic(300, self._check_inactivity)
+        if self._med_schedule:
+            self.add_periodic(60, self._check_medication)
+
         # Callbacks
         self.on_alert_visual = None   # async (type, msg) -> None
         self.on_alert_voice = None    # async (msg) -> None
@@ -34,13 +76,12 @@ class AlertSystem:
         Trigger an alert.
         severity: 'info', 'warning', 'critical'
         """
-        now = datetime.now()
-        cooldown = self.config.get("fall_cooldown_seconds", 30)
+        now = time.monotonic()
 
         # Cooldown check
         if alert_type in self._cooldowns:
-            elapsed = (now - self._cooldowns[alert_type]).total_seconds()
-            if elapsed < cooldown:
+            elapsed = now - self._cooldowns[alert_type]
+            if elapsed < self._cooldown:
                 return
         self._cooldowns[alert_type] = now
 
@@ -58,66 +99,205 @@ class AlertSystem:
             await self.on_alert_voice(f"Alert! {message}")
 
     def _log_alert(self, alert_type, message, severity):
-        """Persist alert to JSONL log file."""
-        log_file = self.data_dir / "alerts.jsonl"
+        """Queue alert for the background JSONL writer."""
         entry = {
             "timestamp": datetime.now().isoformat(),
             "type": alert_type,
             "message": message,
             "severity": severity,
         }
-        with open(log_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        if self._log_queue is None:
+            self._log_queue = asyncio.Queue()
+            self._log_task = asyncio.create_task(self._log_writer())
+        self._log_queue.put_nowait(entry)
 
-    async def check_inactivity(self):
-        """Periodic check for prolonged inactivity."""
-        threshold = self.config.get("inactivity_alert_hours", 4)
+    async def _log_writer(self):
+        """
+        Drain queued alerts into alerts.jsonl.
+        Keeps one file handle open, writes up to 64 entries per batch
+        and flushes once the queue has been idle for 200ms. File I/O
+        runs in a worker thread so it never stalls the render loop.
+        """
+        await _in_thread(self._open_log)
+        dirty = False
         while True:
-            hours = (datetime.now() - self.last_motion).total_seconds() / 3600
-            if hours > threshold:
-                await self.trigger(
-                    "inactivity",
-                    f"No movement for {hours:.1f} hours",
-                    severity="warning"
+            try:
+                entry = await asyncio.wait_for(
+                    self._log_queue.get(), timeout=0.2 if dirty else None
                 )
-            await asyncio.sleep(300)
+            except asyncio.TimeoutError:
+                await _in_thread(self._log_file.flush)
+                dirty = False
+                continue
+
+            batch = [entry]
+            while len(batch) < 64:
+                try:
+                    batch.append(self._log_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            data = b"".join(_dumps(e) + b"\n" for e in batch)
+            await _in_thread(self._log_file.write, data)
+            dirty = True
+            for _ in batch:
+                self._log_queue.task_done()
+
+    def _open_log(self):
+        """Open alerts.jsonl; stores the handle itself so it can't leak."""
+        self._log_file = open(self.data_dir / "alerts.jsonl", "ab", buffering=65536)
+
+    def add_periodic(self, interval, fn):
+        """
+        Register an async check with run_scheduler(). The check runs
+        immediately, then every `interval` seconds — or after however
+        many seconds it returns, if it returns a number.
+        """
+        self._periodics.append([time.monotonic(), interval, fn])
+
+    async def run_scheduler(self):
+        """Run all periodic checks from one task, sleeping until the soonest."""
+        while self._periodics:
+            entry = min(self._periodics, key=lambda p: p[0])
+            delay = entry[0] - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            _, interval, fn = entry
+            try:
+                next_in = await fn()
+            except Exception as e:
+                log.error(f"Periodic check {fn.__name__} failed: {e}")
+                next_in = None
+            entry[0] = time.monotonic() + (interval if next_in is None else next_in)
+
+    async def _check_inactivity(self):
+        """
+        Check for prolonged inactivity. Returns the delay until the
+        threshold could next be crossed; re-alerts every 5 minutes
+        while inactive.
+        """
+        threshold = self.config.get("inactivity_alert_hours", 4) * 3600
+        elapsed = (datetime.now() - self.last_motion).total_seconds()
+        if elapsed > threshold:
+            await self.trigger(
+                "inactivity",
+                f"No movement for {elapsed / 3600:.1f} hours",
+                severity="warning"
+            )
+            return 300
+        # Motion only pushes the deadline later, so waking early
+        # after update_motion() is harmless — we just recompute.
+        return max(60, threshold - elapsed)
 
     def update_motion(self):
         """Called when any motion is detected."""
         self.last_motion = datetime.now()
 
-    async def check_medication_reminders(self):
-        """Check medication schedule and remind."""
-        reminders = self.config.get("medication_reminders", [])
-        if not reminders:
-            return
-
-        while True:
-            now = datetime.now()
-            current_time = now.strftime("%H:%M")
+    def _parse_medication_schedule(self):
+        """Parse reminder "HH:MM" strings into {(hour, minute): [name, ...]}."""
+        schedule = {}
+        for med in self.config.get("medication_reminders", []):
+            for t in med.get("times", []):
+                try:
+                    at = datetime.strptime(t, "%H:%M")
+                except ValueError:
+                    log.warning(f"Bad medication time for {med['name']}: {t!r}")
+                    continue
+                schedule.setdefault((at.hour, at.minute), []).append(med["name"])
+        return schedule
 
-            for med in reminders:
-                if current_time in med.get("times", []):
-                    await self.trigger(
-                        "medication",
-                        f"Time to take {med['name']}",
-                        severity="info"
-                    )
+    def _next_medication_slot(self):
+        """Next scheduled reminder time strictly after the last one handled."""
+        last = self._med_last
+        today = last.replace(second=0, microsecond=0)
+        candidates = []
+        for hh, mm in self._med_schedule:
+            at = today.replace(hour=hh, minute=mm)
+            if at <= last:
+                at += timedelta(days=1)
+            candidates.append(at)
+        return min(candidates)
 
-            await asyncio.sleep(60)
+    async def _check_medication(self):
+        """
+        Remind for any slot that is due; return seconds to the next one,
+        capped at a minute. The scheduler sleeps on the monotonic clock
+        but slots are wall-clock times, which can step (e.g. NTP syncing
+        after boot on an RTC-less Pi), so re-check against it regularly.
+        """
+        slot = self._next_medication_slot()
+        # Timers can fire a hair early; treat anything within 1s as due
+        if (slot - datetime.now()).total_seconds() <= 1:
+            self._med_last = slot
+            for name in self._med_schedule[(slot.hour, slot.minute)]:
+                await self.trigger(
+                    "medication",
+                    f"Time to take {name}",
+                    severity="info"
+                )
+            slot = self._next_medication_slot()
+        return min(60, max(0, (slot - datetime.now()).total_seconds()))
 
-    def get_recent_alerts(self, count=10):
+    async def get_recent_alerts(self, count=10):
         """Get last N alerts from log."""
+        # Let the writer hand everything queued so far to the file first
+        if self._log_task and not self._log_task.done():
+            await self._log_queue.join()
+        return await asyncio.to_thread(self._read_recent_alerts, count)
+
+    def _read_recent_alerts(self, count):
+        """Blocking reader behind get_recent_alerts()."""
         log_file = self.data_dir / "alerts.jsonl"
         if not log_file.exists():
             return []
 
+        if self._log_file:
+            self._log_file.flush()
+
+        # Read backwards in 8 KB chunks until we have enough lines,
+        # so the cost is O(count) rather than O(file size).
+        chunk_size = 8192
+        with open(log_file, "rb") as f:
+            pos = f.seek(0, 2)
+            buf = b""
+            while pos > 0 and buf.count(b"\n") <= count:
+                step = min(chunk_size, pos)
+                pos -= step
+                f.seek(pos)
+                buf = f.read(step) + buf
+
+        lines = buf.splitlines()
+        if pos > 0:
+            lines = lines[1:]  # first line may be partial
+
         alerts = []
-        with open(log_file) as f:
-            for line in f:
-                try:
-                    alerts.append(json.loads(line.strip()))
-                except json.JSONDecodeError:
-                    pass
+        for line in reversed(lines):
+            if len(alerts) >= count:
+                break
+            try:
+                alerts.append(_loads(line))
+            except ValueError:  # json/orjson JSONDecodeError
+                pass
+
+        alerts.reverse()
+        return alerts
 
-        return alerts[-count:]
+    async def cleanup(self):
+        """Stop the writer task and flush any pending alerts to disk."""
+        if self._log_task:
+            self._log_task.cancel()
+            # Let an in-flight open()/write() finish before touching the file
+            try:
+                await self._log_task
+            except asyncio.CancelledError:
+                pass
+            self._log_task = None
+        if self._log_queue is not None and not self._log_queue.empty():
+            if self._log_file is None:
+                self._log_file = open(self.data_dir / "alerts.jsonl", "ab")
+            while not self._log_queue.empty():
+                self._log_file.write(_dumps(self._log_queue.get_nowait()) + b"\n")
+        if self._log_file:
+            self._log_file.close()
+            self._log_file = None
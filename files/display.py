@@ -46,6 +46,13 @@ COLORS = {
     "black":        (0, 0, 0),
 }
 
+# Sensor pill dot colour by status
+STATUS_COLORS = {
+    "connected": COLORS["green"],
+    "pending": COLORS["yellow"],
+    "offline": COLORS["accent"],
+}
+
 
 class DisplayManager:
     """
@@ -59,10 +66,45 @@ class DisplayManager:
         self.width = config["width"]    # 480
         self.height = config["height"]  # 320
         self.fps = config.get("fps", 30)
+        self.idle_fps = config.get("idle_fps", 4)
+        self.target_fps = self.fps   # fps the render loop should run at next
+        self.dirty = asyncio.Event()  # set when state changes between frames
         self.running = False
         self.screen = None
         self.fonts = {}
         self.clock = None
+        self._text_cache = {}   # (font_key, text, color) -> Surface
+
+        # Colours used on per-frame paths, bound once to skip dict lookups
+        self._green = COLORS["green"]
+        self._accent = COLORS["accent"]
+        self._white = COLORS["white"]
+        self._rr_cache = {}     # (w, h, color, radius) -> Surface
+        self._glow_cache = {}   # (radius, color, alpha) -> Surface
+        self._surf_pool = {}    # (w, h) -> reusable SRCALPHA Surface
+        self._header_last_minute = -1
+        self._header_time_surf = None
+        self._header_date_surf = None
+
+        # Dirty-rect rendering: static chrome lives in self._background and
+        # is rebuilt only when _bg_dirty is set; animated regions are
+        # restored from it and pushed with display.update(rects).
+        self._background = None
+        self._bg_dirty = True
+        self._full_redraw = False   # repaint from the cached background
+        self._clock_rect = (8, 2, 180, 36)
+        self._status_dot_rect = (self.width - 100, 16, 9, 9)
+        self._face_rect = (92, 106, 60, 42)
+        self._voice_fx_rect = (308, 60, 100, 100)
+        self._ring_surfs = []   # pulse rings, pre-rendered in init()
+        self._maya_bg = None    # panel chrome, baked in _bake_panels()
+        self._voice_bg = None
+        self._face_surfs = {}   # (blink_state, smiling) -> Surface
+        self._sensor_pills = []  # (x, width, text Surface, dot color)
+        self._sensor_bar_dirty = True
+
+        # 256-entry sine table for the waveform bars
+        self._sin_lut = [math.sin(i * 2 * math.pi / 256) for i in range(256)]
 
         # State
         self.sensor_data = {}
@@ -77,6 +119,7 @@ class DisplayManager:
         # Animation state
         self.blink_timer = 0
         self.blink_state = False
+        self._face_blink_drawn = None   # blink_state the face was last drawn with
         self.wave_offset = 0
         self.mood_index = 0
         self.mood_timer = 0
@@ -116,6 +159,11 @@ class DisplayManager:
 
             self.clock = pygame.time.Clock()
 
+            # Only queue the events render_frame() handles; drops the
+            # stream of motion events touch panels generate.
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN])
+
             # Load fonts
             pygame.font.init()
             font_path = None
@@ -149,6 +197,15 @@ class DisplayManager:
                 self.fonts["small"] = pygame.font.SysFont(None, 14)
                 self.fonts["tiny"] = pygame.font.SysFont(None, 11)
 
+            # Pulse rings — alpha is modulated per frame with set_alpha()
+            for i in range(3):
+                radius = 30 + i * 10
+                ring = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(ring, COLORS["accent"], (radius, radius), radius, 2)
+                self._ring_surfs.append(ring)
+
+            self._bake_panels()
+
             self.running = True
             log.info(f"Display initialized: {self.width}x{self.height}")
             return True
@@ -160,7 +217,12 @@ class DisplayManager:
 
     def update_sensor(self, name, status, value):
         """Update sensor data for display."""
-        self.sensor_data[name] = {"status": status, "value": value}
+        data = {"status": status, "value": value}
+        if self.sensor_data.get(name) != data:
+            self.sensor_data[name] = data
+            self._sensor_bar_dirty = True
+            self._bg_dirty = True
+            self.dirty.set()
 
     def set_voice_active(self, active, text=None):
         """Update voice interaction state."""
@@ -168,25 +230,35 @@ class DisplayManager:
         if text:
             self.voice_text = text
         self.last_activity = time.time()
+        self._bg_dirty = True
+        self.dirty.set()
 
     def set_mood(self, mood_text):
         """Set maya mood message."""
         self.maya_mood = mood_text
+        self._bg_dirty = True
+        self.dirty.set()
 
     def set_message(self, text):
         """Set bottom message bar text."""
         self.message_text = text
         self.last_activity = time.time()
+        self._bg_dirty = True
+        self.dirty.set()
 
     def trigger_alert(self, message):
         """Activate alert overlay."""
         self.alert_active = True
         self.alert_message = message
         self.last_activity = time.time()
+        self.dirty.set()
 
     def dismiss_alert(self):
         """Dismiss alert overlay."""
         self.alert_active = False
+        # Background is unchanged — just repaint the screen from it
+        self._full_redraw = True
+        self.dirty.set()
 
     def render_frame(self):
         """Render one frame of the UI."""
@@ -195,7 +267,9 @@ class DisplayManager:
 
         pg = self.pygame
         screen = self.screen
-        dt = self.clock.tick(self.fps) / 1000.0
+        # Pacing is left to the caller's asyncio sleep (see target_fps);
+        # tick() only measures the frame delta here.
+        dt = self.clock.tick() / 1000.0
 
         # Handle pygame events
         for event in pg.event.get():
@@ -214,8 +288,7 @@ class DisplayManager:
                 # Touch on right half = voice toggle
                 x, y = event.pos
                 if x > self.width // 2 and 40 < y < 260:
-                    self.voice_active = not self.voice_active
-                    self.last_activity = time.time()
+                    self.set_voice_active(not self.voice_active)
 
         # Update animations
         self.blink_timer += dt
@@ -231,78 +304,143 @@ class DisplayManager:
             self.mood_timer = 0
             self.mood_index = (self.mood_index + 1) % len(self.moods)
             if not self.voice_active:
-                self.maya_mood = self.moods[self.mood_index]
+                self.set_mood(self.moods[self.mood_index])
 
         # ─── Draw ───────────────────────────────────────────
-        screen.fill(COLORS["bg"])
+        full_update = self._bg_dirty or self._full_redraw or self.alert_active
+        if self._bg_dirty:
+            self._render_background()
+            self._bg_dirty = False
+        self._full_redraw = False
+
+        # Animated regions — the clock only changes once a minute and the
+        # face only while talking or when the blink state flips
+        redraw_clock = (full_update
+                        or datetime.now().minute != self._header_last_minute)
+        redraw_face = (full_update or self.voice_active
+                       or self.blink_state != self._face_blink_drawn)
+
+        if full_update:
+            screen.blit(self._background, (0, 0))
+        else:
+            self._restore_background(screen, redraw_clock, redraw_face)
+
+        dirty = [self._draw_status_dot(screen)]
+        if redraw_clock:
+            dirty.append(self._draw_clock(screen))
+        if redraw_face:
+            dirty.append(self._draw_maya_face(screen))
+            self._face_blink_drawn = self.blink_state
+        if self.voice_active:
+            dirty.append(self._draw_voice_effects(screen))
+
+        # Alert overlay (on top of everything)
+        if self.alert_active:
+            self._draw_alert_overlay(screen, dt)
+
+        if full_update:
+            pg.display.flip()
+        else:
+            pg.display.update(dirty)
+
+        # Drop to idle_fps when nothing is animating; stay at full rate
+        # while listening, alerting, or about to blink.
+        animating = (self.voice_active or self.alert_active or self.blink_state
+                     or self.blink_timer > 4.0 - 1.0 / self.idle_fps)
+        self.target_fps = self.fps if animating else self.idle_fps
+
+    def _render_background(self):
+        """Redraw the static chrome into the cached background surface."""
+        pg = self.pygame
+        if self._background is None:
+            self._background = pg.Surface((self.width, self.height)).convert()
+        bg = self._background
+        bg.fill(COLORS["bg"])
 
         # Ambient glow effects
-        self._draw_glow(screen, 60, 60, 120, COLORS["accent"], 40)
-        self._draw_glow(screen, 420, 280, 150, COLORS["green"], 30)
+        self._draw_glow(bg, 60, 60, 120, COLORS["accent"], 40)
+        self._draw_glow(bg, 420, 280, 150, COLORS["green"], 30)
 
         # Header
-        self._draw_header(screen)
+        self._draw_header(bg)
 
         # Main panels
-        self._draw_maya_panel(screen, dt)
-        self._draw_voice_panel(screen, dt)
+        self._draw_maya_panel(bg)
+        self._draw_voice_panel(bg)
 
         # Sensor bar
-        self._draw_sensor_bar(screen)
+        self._draw_sensor_bar(bg)
 
         # Message bar
-        self._draw_message_bar(screen)
-
-        # Alert overlay (on top of everything)
-        if self.alert_active:
-            self._draw_alert_overlay(screen, dt)
-
-        pg.display.flip()
+        self._draw_message_bar(bg)
+
+    def _restore_background(self, screen, clock=False, face=True):
+        """Erase last frame's animated regions with the cached background."""
+        rects = [self._status_dot_rect]
+        if clock:
+            rects.append(self._clock_rect)
+        if face:
+            rects.append(self._face_rect)
+        if self.voice_active:
+            rects.append(self._voice_fx_rect)
+        for rect in rects:
+            screen.blit(self._background, rect, rect)
+
+    def _text(self, font_key, text, color):
+        """Render text once and reuse the Surface until it is evicted."""
+        key = (font_key, text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = self.fonts[font_key].render(text, True, color)
+            if len(self._text_cache) >= 64:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._text_cache[next(iter(self._text_cache))]
+            self._text_cache[key] = surf
+        return surf
+
+    def _alpha_surf(self, w, h, clear=True):
+        """Return a pooled SRCALPHA surface, optionally cleared to transparent."""
+        surf = self._surf_pool.get((w, h))
+        if surf is None:
+            surf = self.pygame.Surface((w, h), self.pygame.SRCALPHA)
+            self._surf_pool[(w, h)] = surf
+        elif clear:
+            surf.fill((0, 0, 0, 0))
+        return surf
 
     def _draw_glow(self, screen, cx, cy, radius, color, alpha):
         """Draw a soft ambient glow circle."""
-        glow = self.pygame.Surface((radius * 2, radius * 2), self.pygame.SRCALPHA)
-        for r in range(radius, 0, -2):
-            a = int(alpha * (r / radius))
-            self.pygame.draw.circle(
-                glow, (*color[:3], a), (radius, radius), r
-            )
+        key = (radius, color, alpha)
+        glow = self._glow_cache.get(key)
+        if glow is None:
+            glow = self.pygame.Surface((radius * 2, radius * 2), self.pygame.SRCALPHA)
+            for r in range(radius, 0, -2):
+                a = int(alpha * (r / radius))
+                self.pygame.draw.circle(
+                    glow, (*color[:3], a), (radius, radius), r
+                )
+            self._glow_cache[key] = glow
         screen.blit(glow, (cx - radius, cy - radius))
 
     def _draw_rounded_rect(self, screen, rect, color, radius=12):
         """Draw a rounded rectangle."""
         pg = self.pygame
         x, y, w, h = rect
-        pg.draw.rect(screen, color, (x + radius, y, w - 2*radius, h))
-        pg.draw.rect(screen, color, (x, y + radius, w, h - 2*radius))
-        pg.draw.circle(screen, color, (x + radius, y + radius), radius)
-        pg.draw.circle(screen, color, (x + w - radius, y + radius), radius)
-        pg.draw.circle(screen, color, (x + radius, y + h - radius), radius)
-        pg.draw.circle(screen, color, (x + w - radius, y + h - radius), radius)
+        key = (w, h, color, radius)
+        surf = self._rr_cache.get(key)
+        if surf is None:
+            surf = pg.Surface((w, h), pg.SRCALPHA)
+            pg.draw.rect(surf, color, (0, 0, w, h), border_radius=radius)
+            self._rr_cache[key] = surf
+        screen.blit(surf, (x, y))
 
     def _draw_header(self, screen):
-        """Draw the top header bar with time and status."""
-        now = datetime.now()
-        time_str = now.strftime("%H:%M")
-        date_str = now.strftime("%a, %b %d")
-
-        # Time
-        time_surf = self.fonts["large_bold"].render(time_str, True, COLORS["white"])
-        screen.blit(time_surf, (12, 6))
-
-        # Date
-        date_surf = self.fonts["small"].render(date_str, True, COLORS["text_dim"])
-        screen.blit(date_surf, (90, 16))
-
+        """Draw the static header chrome (status badge and separator)."""
         # Status badge
         badge_x = self.width - 110
         self._draw_rounded_rect(screen, (badge_x, 8, 100, 24), COLORS["surface"], 12)
-        # Green dot
-        dot_pulse = abs(math.sin(time.time() * 2)) * 0.3 + 0.7
-        dot_color = tuple(int(c * dot_pulse) for c in COLORS["green"])
-        self.pygame.draw.circle(screen, dot_color, (badge_x + 14, 20), 4)
         # Status text
-        status_surf = self.fonts["small"].render("All OK", True, COLORS["green"])
+        status_surf = self._text("small", "All OK", COLORS["green"])
         screen.blit(status_surf, (badge_x + 24, 11))
 
         # Separator line
@@ -311,117 +449,165 @@ class DisplayManager:
             (8, 38), (self.width - 8, 38), 1
         )
 
-    def _draw_maya_panel(self, screen, dt):
-        """Draw the maya face panel on the left."""
-        pg = self.pygame
-        panel_rect = (8, 44, 228, 196)
-        self._draw_rounded_rect(screen, panel_rect, COLORS["surface"], 14)
-
-        # Top accent line
-        pg.draw.line(screen, COLORS["green"], (60, 44), (180, 44), 2)
-
-        cx, cy = 122, 120  # face center
+    def _draw_clock(self, screen):
+        """Draw the header time and date."""
+        # Time and date only change once a minute — re-render then
+        now = datetime.now()
+        if now.minute != self._header_last_minute:
+            self._header_last_minute = now.minute
+            self._header_time_surf = self.fonts["large_bold"].render(
+                now.strftime("%H:%M"), True, COLORS["white"]
+            )
+            self._header_date_surf = self.fonts["small"].render(
+                now.strftime("%a, %b %d"), True, COLORS["text_dim"]
+            )
 
-        # Eyes
-        eye_y = cy - 12
-        eye_h = 16 if not self.blink_state else 2
-        eye_y_offset = 0 if not self.blink_state else 7
+        # Time
+        screen.blit(self._header_time_surf, (12, 6))
 
-        # Left eye
-        pg.draw.ellipse(screen, COLORS["green"],
-                        (cx - 28, eye_y + eye_y_offset, 16, eye_h))
-        if not self.blink_state:
-            pg.draw.circle(screen, COLORS["white"], (cx - 22, eye_y + 4), 4)
+        # Date
+        screen.blit(self._header_date_surf, (90, 16))
+
+        return self._clock_rect
+
+    def _draw_status_dot(self, screen):
+        """Draw the pulsing green dot in the header badge."""
+        dot_pulse = abs(math.sin(time.monotonic() * 2)) * 0.3 + 0.7
+        r, g, b = self._green
+        dot_color = (int(r * dot_pulse), int(g * dot_pulse), int(b * dot_pulse))
+        self.pygame.draw.circle(screen, dot_color, (self.width - 96, 20), 4)
+        return self._status_dot_rect
+
+    def _bake_panels(self):
+        """
+        Pre-render the invariant panel chrome and face variants.
+        Panel surfaces start 2px above the panel so the accent line
+        drawn on its top edge is captured whole.
+        """
+        pg = self.pygame
 
-        # Right eye
-        pg.draw.ellipse(screen, COLORS["green"],
-                        (cx + 12, eye_y + eye_y_offset, 16, eye_h))
-        if not self.blink_state:
-            pg.draw.circle(screen, COLORS["white"], (cx + 18, eye_y + 4), 4)
+        # Maya panel: card, accent line, label
+        surf = pg.Surface((228, 198), pg.SRCALPHA)
+        self._draw_rounded_rect(surf, (0, 2, 228, 196), COLORS["surface"], 14)
+        pg.draw.line(surf, COLORS["green"], (52, 2), (172, 2), 2)
+        label = self._text("tiny", "MAYA", COLORS["text_dim"])
+        surf.blit(label, label.get_rect(centerx=114, y=126))
+        self._maya_bg = surf
 
-        # Mouth (smile)
-        if self.voice_active:
-            # Talking animation
-            mouth_h = int(6 + abs(math.sin(time.time() * 8)) * 8)
-            pg.draw.ellipse(screen, COLORS["green"],
-                            (cx - 10, cy + 12, 20, mouth_h), 2)
-        else:
-            pg.draw.arc(screen, COLORS["green"],
-                        (cx - 12, cy + 5, 24, 16),
-                        3.14, 2 * 3.14, 2)
+        # Voice panel: card, accent line, mic icon, label
+        surf = pg.Surface((228, 198), pg.SRCALPHA)
+        self._draw_rounded_rect(surf, (0, 2, 228, 196), COLORS["surface"], 14)
+        pg.draw.line(surf, COLORS["accent"], (52, 2), (172, 2), 2)
 
-        # Label
-        label = self.fonts["tiny"].render("MAYA", True, COLORS["text_dim"])
-        label_rect = label.get_rect(centerx=cx, y=168)
-        screen.blit(label, label_rect)
+        cx, cy = 114, 68  # mic center
+        mic_radius = 22
+        pg.draw.circle(surf, COLORS["card"], (cx, cy), mic_radius)
+        pg.draw.circle(surf, COLORS["accent"], (cx, cy), mic_radius, 2)
+        pg.draw.rect(surf, COLORS["accent"], (cx-4, cy-12, 8, 16), border_radius=4)
+        pg.draw.arc(surf, COLORS["accent"], (cx-8, cy-4, 16, 16), 3.14, 0, 2)
+        pg.draw.line(surf, COLORS["accent"], (cx, cy+10), (cx, cy+14), 2)
+        pg.draw.line(surf, COLORS["accent"], (cx-4, cy+14), (cx+4, cy+14), 2)
+
+        label = self._text("tiny", "VOICE", COLORS["text_dim"])
+        surf.blit(label, label.get_rect(centerx=cx, y=126))
+        self._voice_bg = surf
+
+        # Face: eyes open/blinking, with or without the resting smile.
+        # Coordinates are relative to self._face_rect.
+        cx, cy = 30, 14  # face center
+        for blink in (False, True):
+            for smiling in (False, True):
+                surf = pg.Surface(self._face_rect[2:], pg.SRCALPHA)
+                eye_y = cy - 12
+                eye_h = 2 if blink else 16
+                eye_y_offset = 7 if blink else 0
+
+                # Left eye
+                pg.draw.ellipse(surf, COLORS["green"],
+                                (cx - 28, eye_y + eye_y_offset, 16, eye_h))
+                if not blink:
+                    pg.draw.circle(surf, COLORS["white"], (cx - 22, eye_y + 4), 4)
+
+                # Right eye
+                pg.draw.ellipse(surf, COLORS["green"],
+                                (cx + 12, eye_y + eye_y_offset, 16, eye_h))
+                if not blink:
+                    pg.draw.circle(surf, COLORS["white"], (cx + 18, eye_y + 4), 4)
+
+                # Mouth (smile)
+                if smiling:
+                    pg.draw.arc(surf, COLORS["green"],
+                                (cx - 12, cy + 5, 24, 16),
+                                3.14, 2 * 3.14, 2)
+
+                self._face_surfs[(blink, smiling)] = surf
+
+    def _draw_maya_panel(self, screen):
+        """Draw the maya face panel on the left (minus the face)."""
+        screen.blit(self._maya_bg, (8, 42))
 
         # Mood text
-        mood = self.fonts["small"].render(self.maya_mood, True, COLORS["green"])
-        mood_rect = mood.get_rect(centerx=cx, y=184)
+        mood = self._text("small", self.maya_mood, COLORS["green"])
+        mood_rect = mood.get_rect(centerx=122, y=184)
         screen.blit(mood, mood_rect)
 
-    def _draw_voice_panel(self, screen, dt):
-        """Draw the voice interaction panel on the right."""
-        pg = self.pygame
-        panel_rect = (244, 44, 228, 196)
-        border_color = COLORS["accent"] if self.voice_active else COLORS["surface"]
-        self._draw_rounded_rect(screen, panel_rect, COLORS["surface"], 14)
-
-        # Top accent line
-        pg.draw.line(screen, COLORS["accent"], (296, 44), (416, 44), 2)
+    def _draw_maya_face(self, screen):
+        """Draw the animated eyes and mouth."""
+        face = self._face_surfs[(self.blink_state, not self.voice_active)]
+        screen.blit(face, self._face_rect)
 
-        cx, cy = 358, 110  # center
-
-        # Mic icon circle
-        mic_radius = 22
-        pg.draw.circle(screen, COLORS["card"], (cx, cy), mic_radius)
-        pg.draw.circle(screen, COLORS["accent"], (cx, cy), mic_radius, 2)
-
-        # Mic shape
-        pg.draw.rect(screen, COLORS["accent"], (cx-4, cy-12, 8, 16), border_radius=4)
-        pg.draw.arc(screen, COLORS["accent"], (cx-8, cy-4, 16, 16), 3.14, 0, 2)
-        pg.draw.line(screen, COLORS["accent"], (cx, cy+10), (cx, cy+14), 2)
-        pg.draw.line(screen, COLORS["accent"], (cx-4, cy+14), (cx+4, cy+14), 2)
-
-        # Pulse rings when listening
         if self.voice_active:
-            for i in range(3):
-                radius = mic_radius + 8 + i * 10
-                alpha = max(0, 180 - i * 60 - int(self.wave_offset * 30) % 60)
-                ring_surf = pg.Surface((radius*2, radius*2), pg.SRCALPHA)
-                pg.draw.circle(ring_surf, (*COLORS["accent"], alpha),
-                               (radius, radius), radius, 2)
-                screen.blit(ring_surf, (cx - radius, cy - radius))
+            # Talking animation
+            cx, cy = 122, 120  # face center
+            mouth_h = int(6 + abs(math.sin(time.monotonic() * 8)) * 8)
+            self.pygame.draw.ellipse(screen, self._green,
+                                     (cx - 10, cy + 12, 20, mouth_h), 2)
 
-        # Waveform bars
-        if self.voice_active:
-            bar_y = cy + 36
-            bar_width = 3
-            bar_gap = 5
-            num_bars = 9
-            start_x = cx - (num_bars * (bar_width + bar_gap)) // 2
-            for i in range(num_bars):
-                h = int(4 + abs(math.sin(self.wave_offset + i * 0.7)) * 14)
-                bx = start_x + i * (bar_width + bar_gap)
-                pg.draw.rect(screen, COLORS["accent"],
-                             (bx, bar_y - h//2, bar_width, h), border_radius=1)
-
-        # Label
-        label = self.fonts["tiny"].render("VOICE", True, COLORS["text_dim"])
-        label_rect = label.get_rect(centerx=cx, y=168)
-        screen.blit(label, label_rect)
+        return self._face_rect
+
+    def _draw_voice_panel(self, screen):
+        """Draw the voice panel on the right (minus the listening effects)."""
+        screen.blit(self._voice_bg, (244, 42))
 
         # Status text
         status_color = COLORS["accent"] if self.voice_active else COLORS["text_dim"]
         status_text = "Listening..." if self.voice_active else self.voice_text
-        status = self.fonts["small"].render(status_text, True, status_color)
-        status_rect = status.get_rect(centerx=cx, y=184)
+        status = self._text("small", status_text, status_color)
+        status_rect = status.get_rect(centerx=358, y=184)
         screen.blit(status, status_rect)
 
-    def _draw_sensor_bar(self, screen):
-        """Draw the bottom sensor status pills."""
+    def _draw_voice_effects(self, screen):
+        """Draw the pulse rings and waveform shown while listening."""
         pg = self.pygame
-        y = 248
+        cx, cy = 358, 110  # center
+        mic_radius = 22
+
+        # Pulse rings
+        for i, ring_surf in enumerate(self._ring_surfs):
+            radius = mic_radius + 8 + i * 10
+            alpha = max(0, 180 - i * 60 - int(self.wave_offset * 30) % 60)
+            ring_surf.set_alpha(alpha)
+            screen.blit(ring_surf, (cx - radius, cy - radius))
+
+        # Waveform bars
+        bar_y = cy + 36
+        bar_width = 3
+        bar_gap = 5
+        num_bars = 9
+        start_x = cx - (num_bars * (bar_width + bar_gap)) // 2
+        lut = self._sin_lut
+        scale = 256 / (2 * math.pi)
+        for i in range(num_bars):
+            idx = int((self.wave_offset + i * 0.7) * scale) & 255
+            h = int(4 + abs(lut[idx]) * 14)
+            bx = start_x + i * (bar_width + bar_gap)
+            pg.draw.rect(screen, self._accent,
+                         (bx, bar_y - h//2, bar_width, h), border_radius=1)
+
+        return self._voice_fx_rect
+
+    def _build_sensor_pills(self):
+        """Lay out the sensor pills; runs only when sensor state changes."""
         x = 8
 
         # Default sensors (always shown)
@@ -435,33 +621,43 @@ class DisplayManager:
             for name, data in self.sensor_data.items()
         ]
 
+        pills = []
         for name, status, value in all_sensors:
-            # Pill background
-            text = f"{name}: {value}"
-            text_surf = self.fonts["tiny"].render(text, True, COLORS["text_dim"])
+            text_surf = self.fonts["tiny"].render(
+                f"{name}: {value}", True, COLORS["text_dim"]
+            )
             pill_w = text_surf.get_width() + 22
+            dot_color = STATUS_COLORS.get(status, COLORS["text_dim"])
+            pills.append((x, pill_w, text_surf, dot_color))
+
+            x += pill_w + 6
+            if x > self.width - 50:
+                break  # don't overflow
+
+        self._sensor_pills = pills
+        self._sensor_bar_dirty = False
+
+    def _draw_sensor_bar(self, screen):
+        """Draw the bottom sensor status pills."""
+        if self._sensor_bar_dirty:
+            self._build_sensor_pills()
+
+        pg = self.pygame
+        y = 248
+        for x, pill_w, text_surf, dot_color in self._sensor_pills:
+            # Pill background
             self._draw_rounded_rect(screen, (x, y, pill_w, 20), COLORS["surface"], 10)
 
             # Status dot
-            dot_colors = {
-                "connected": COLORS["green"],
-                "pending": COLORS["yellow"],
-                "offline": COLORS["accent"],
-            }
-            dot_color = dot_colors.get(status, COLORS["text_dim"])
             pg.draw.circle(screen, dot_color, (x + 10, y + 10), 3)
 
             # Text
             screen.blit(text_surf, (x + 18, y + 4))
 
-            x += pill_w + 6
-            if x > self.width - 50:
-                break  # don't overflow
-
     def _draw_message_bar(self, screen):
         """Draw the bottom message/status bar."""
         y = 275
-        msg = self.fonts["small"].render(self.message_text, True, COLORS["text_dim"])
+        msg = self._text("small", self.message_text, COLORS["text_dim"])
         msg_rect = msg.get_rect(centerx=self.width // 2, y=y)
         screen.blit(msg, msg_rect)
 
@@ -470,35 +666,29 @@ class DisplayManager:
         pg = self.pygame
 
         # Flashing red background
-        flash = abs(math.sin(time.time() * 4))
+        flash = abs(math.sin(time.monotonic() * 4))
         alpha = int(200 + flash * 55)
-        overlay = pg.Surface((self.width, self.height), pg.SRCALPHA)
-        overlay.fill((*COLORS["accent"], min(alpha, 255)))
+        overlay = self._alpha_surf(self.width, self.height, clear=False)
+        overlay.fill((*self._accent, min(alpha, 255)))
         screen.blit(overlay, (0, 0))
 
         # Warning icon
-        icon = self.fonts["large_bold"].render("⚠", True, COLORS["white"])
+        icon = self._text("large_bold", "⚠", self._white)
         icon_rect = icon.get_rect(centerx=self.width//2, centery=100)
         screen.blit(icon, icon_rect)
 
         # Alert text
-        alert = self.fonts["large_bold"].render(
-            self.alert_message, True, COLORS["white"]
-        )
+        alert = self._text("large_bold", self.alert_message, self._white)
         alert_rect = alert.get_rect(centerx=self.width//2, centery=160)
         screen.blit(alert, alert_rect)
 
         # Sub text
-        sub = self.fonts["medium"].render(
-            "Contacting emergency...", True, COLORS["white"]
-        )
+        sub = self._text("medium", "Contacting emergency...", self._white)
         sub_rect = sub.get_rect(centerx=self.width//2, centery=200)
         screen.blit(sub, sub_rect)
 
         # Dismiss instruction
-        dismiss = self.fonts["small"].render(
-            "Touch screen to dismiss", True, COLORS["white"]
-        )
+        dismiss = self._text("small", "Touch screen to dismiss", self._white)
         dismiss_rect = dismiss.get_rect(centerx=self.width//2, centery=280)
         screen.blit(dismiss, dismiss_rect)
 
@@ -24,11 +24,16 @@ import asyncio
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from config.settings import CONFIG, load_config
+from config.settings import load_config, freeze
 from modules.display import DisplayManager
 from modules.voice import VoiceAssistant
 from modules.sensors import SensorHub, DemoSensors
@@ -52,16 +57,21 @@ class Maya:
     """Main application orchestrator."""
 
     def __init__(self):
-        load_config()
+        cfg = freeze(load_config())
 
         # Initialize subsystems
-        self.display = DisplayManager(CONFIG["display"], demo=DEMO_MODE)
-        self.voice = VoiceAssistant(CONFIG["voice"], CONFIG["audio"])
-        self.sensors = SensorHub(CONFIG["sensors"])
-        self.alerts = AlertSystem(CONFIG["alerts"], CONFIG["general"]["data_dir"])
+        self.display = DisplayManager(cfg["display"], demo=DEMO_MODE)
+        self.voice = VoiceAssistant(cfg["voice"], cfg["audio"])
+        self.sensors = SensorHub(cfg["sensors"])
+        self.alerts = AlertSystem(cfg["alerts"], cfg["general"]["data_dir"])
 
         self._tasks = []
         self._running = True
+        self._shutdown = asyncio.Event()
+
+    def request_stop(self):
+        """Ask start() to shut down; safe to call any number of times."""
+        self._shutdown.set()
 
     async def start(self):
         """Initialize and run all subsystems."""
@@ -116,10 +126,7 @@ class Maya:
             self.alerts.on_alert_visual = on_visual_alert
 
         self._tasks.append(
-            asyncio.create_task(self.alerts.check_inactivity())
-        )
-        self._tasks.append(
-            asyncio.create_task(self.alerts.check_medication_reminders())
+            asyncio.create_task(self.alerts.run_scheduler())
         )
 
         # ─── Voice ──────────────────────────────────────────
@@ -150,13 +157,14 @@ class Maya:
 
             # Add voice commands that read sensor data
             async def cmd_readings(cmd):
-                readings = self.sensors.get_all_readings()
-                parts = []
-                for name, data in readings.items():
-                    if data["status"] == "connected":
-                        parts.append(f"{name}: {data['value']}")
+                # get_all_readings() is cached until a sensor's state changes
+                parts = ", ".join(
+                    f"{name}: {data['value']}"
+                    for name, data in self.sensors.get_all_readings().items()
+                    if data["status"] == "connected"
+                )
                 if parts:
-                    return "Your current readings are: " + ", ".join(parts)
+                    return "Your current readings are: " + parts
                 return "No sensors are connected yet."
 
             self.voice.register_command(
@@ -177,29 +185,63 @@ class Maya:
         log.info("All systems started ✓")
 
         # ─── Main render loop ───────────────────────────────
+        # Run until the window closes or a shutdown is requested
+        # (headless mode only waits for the latter), then stop once.
+        waiters = {asyncio.create_task(self._shutdown.wait())}
         if not NO_DISPLAY:
-            await self._render_loop()
-        else:
-            # Headless mode — just keep running
-            while self._running:
-                await asyncio.sleep(0.1)
+            waiters.add(asyncio.create_task(self._render_loop()))
+        done, pending = await asyncio.wait(
+            waiters, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in pending:
+            task.cancel()
+        for task in done:
+            task.result()   # surface render loop errors to main()
+        await self.stop()
 
     async def _render_loop(self):
-        """Main display render loop at configured FPS."""
-        while self._running and self.display.running:
-            self.display.render_frame()
-            await asyncio.sleep(1.0 / self.display.fps)
+        """
+        Main display render loop. Renders at the display's target FPS
+        (full rate while animating, idle_fps otherwise), and right away
+        when sensor, mood, message or alert state changes — but never
+        faster than display.fps.
+        """
+        loop = asyncio.get_running_loop()
+        display = self.display
+        min_frame = 1.0 / display.fps
+        while self._running and display.running:
+            started = loop.time()
+            # Changes made before (or during) this frame are drawn by it
+            display.dirty.clear()
+            display.render_frame()
+
+            try:
+                await asyncio.wait_for(
+                    display.dirty.wait(), 1.0 / display.target_fps
+                )
+            except asyncio.TimeoutError:
+                pass
+
+            delay = started + min_frame - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
 
     async def stop(self):
-        """Graceful shutdown."""
+        """Graceful shutdown (idempotent)."""
+        if not self._running:
+            return
         log.info("Shutting down...")
         self._running = False
 
+        # Let tasks actually finish unwinding before their resources
+        # (I2C bus, audio stream, pygame) are torn down underneath them
         for task in self._tasks:
             task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
 
         self.voice.cleanup()
         self.sensors.cleanup()
+        await self.alerts.cleanup()
         self.display.cleanup()
 
         log.info("Goodbye! 👋")
@@ -231,7 +273,7 @@ async def main():
     loop = asyncio.get_event_loop()
     for sig in (signal.SIGINT, signal.SIGTERM):
         try:
-            loop.add_signal_handler(sig, lambda: asyncio.create_task(app.stop()))
+            loop.add_signal_handler(sig, app.request_stop)
         except NotImplementedError:
             pass  # Windows doesn't support add_signal_handler
 
@@ -245,4 +287,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop's libuv loop makes task/timer scheduling noticeably
+    # cheaper on the Pi; fall back to the stock loop without it.
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
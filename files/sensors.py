@@ -14,22 +14,77 @@ Supported sensors (add as you buy them):
 """
 
 import time
+import heapq
 import logging
 import asyncio
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 log = logging.getLogger("SensorHub")
 
+# How long a bus scan result is trusted by probe() before re-reading
+I2C_SCAN_TTL = 30.0
+
+# A read_fn that takes longer than this counts as a read error
+READ_TIMEOUT = 5.0
+
+# Unchanged readings are not re-sent to callbacks, except every Nth one
+# so the display can recover from a missed update
+FORCE_EMIT_EVERY = 30
+
+# Sensor status codes. Stored as ints internally; callbacks and the
+# public getters see the names in STATUS_NAMES.
+PENDING, CONNECTED, OFFLINE = 0, 1, 2
+STATUS_NAMES = ("pending", "connected", "offline")
+
+# Names for devices scan_i2c() recognises by address
+KNOWN_I2C_ADDRS = {
+    0x68: "MPU6050",
+    0x57: "MAX30102",
+    0x76: "BME280",
+    0x77: "BME280-alt",
+    0x5A: "MLX90614",
+    0x23: "BH1750",
+}
+
 
 class SensorHub:
     """Central manager for all hardware sensors."""
 
     def __init__(self, sensor_config):
         self.config = sensor_config
-        self.sensors = {}
         self.callbacks = []     # async functions called on sensor update
+        self._callbacks = ()    # tuple snapshot of callbacks for the poll path
         self._tasks = []
+        self._pending = {}          # index -> in-flight poll task
+        # Samples flow poll -> queue -> _dispatch_loop -> callbacks, so
+        # slow consumers (display, alerts) never hold up the readers
+        self._events = asyncio.Queue(maxsize=256)
+        # Minimum spacing between value updates sent per sensor
+        self._min_period = sensor_config.get("display_min_period_ms", 50) / 1000
+        self._last_emit = {}    # name -> (time.monotonic(), status) last sent
+
+        # Per-sensor state as parallel lists, indexed via self._idx[name]
+        self._idx = {}
+        self._names = []
+        self._status = []           # PENDING / CONNECTED / OFFLINE
+        self._value = []
+        self._read_fn = []
+        self._interval = []
+        self._addr = []
+        self._last_read = []        # time.monotonic() of last successful read
+        self._err = []
+        self._unchanged = []        # consecutive polls with the same value
+        self._emitted = []          # status last sent to callbacks
+
+        # get_all_readings() result, reused until status/value changes
+        self._gen = 0
+        self._readings_cache = (None, -1)
         self._bus = None
+        # One worker serialises all smbus2 I/O (the bus isn't thread-safe)
+        # and keeps blocking transfers off the event loop.
+        self._io_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="i2c")
+        self._i2c_cache = None      # {addr: name} from the last scan
+        self._i2c_cache_time = 0.0
 
     def init(self):
         """Initialize I2C bus."""
@@ -45,154 +100,315 @@ class SensorHub:
     def on_update(self, callback):
         """Register callback: async callback(name, status, value)"""
         self.callbacks.append(callback)
+        self._callbacks = tuple(self.callbacks)
+
+    def _emit(self, name, status, value):
+        """Queue an update for the dispatcher, dropping the oldest if full."""
+        item = (name, status, value, time.monotonic())
+        try:
+            self._events.put_nowait(item)
+        except asyncio.QueueFull:
+            self._events.get_nowait()
+            self._events.put_nowait(item)
+
+    async def _dispatch_loop(self):
+        """
+        Deliver queued sensor updates to callbacks in arrival order.
+        Value updates arriving within _min_period of the last one sent
+        for the same sensor are coalesced: only the newest goes out,
+        once the window closes. Status changes are never held back.
+        """
+        held = {}   # name -> (status, value) waiting for its window to close
+        while True:
+            # Flush due entries every pass, not only on timeout: with items
+            # already queued, wait_for(get(), 0) returns one instead of
+            # timing out, so a busy queue would starve held values
+            now = time.monotonic()
+            for n in [n for n in held
+                      if now - self._last_emit[n][0] >= self._min_period]:
+                await self._deliver(n, *held.pop(n))
+
+            timeout = None
+            if held:
+                due = min(self._last_emit[n][0] for n in held) + self._min_period
+                timeout = max(0.0, due - time.monotonic())
+            try:
+                name, status, value, _ts = await asyncio.wait_for(
+                    self._events.get(), timeout
+                )
+            except asyncio.TimeoutError:
+                continue
+
+            last = self._last_emit.get(name)
+            if (last and last[1] == status
+                    and time.monotonic() - last[0] < self._min_period):
+                held[name] = (status, value)
+                continue
+            held.pop(name, None)
+            await self._deliver(name, status, value)
+
+    async def _deliver(self, name, status, value):
+        """Notify callbacks and start the sensor's coalescing window."""
+        self._last_emit[name] = (time.monotonic(), status)
+        await self._notify(name, status, value)
+
+    async def _notify(self, name, status, value):
+        """Run all update callbacks concurrently, logging any failures."""
+        results = await asyncio.gather(
+            *(cb(name, status, value) for cb in self._callbacks),
+            return_exceptions=True,
+        )
+        for r in results:
+            if isinstance(r, Exception):
+                log.error(f"Callback error: {r}")
 
     async def scan_i2c(self):
         """Scan I2C bus for connected devices."""
         if not self._bus:
             return {}
 
+        # ~117 bus transactions — keep them off the event loop
+        loop = asyncio.get_running_loop()
+        found = await loop.run_in_executor(self._io_exec, self._scan_blocking)
+        for addr, name in found.items():
+            log.info(f"I2C device found: {name} at 0x{addr:02x}")
+
+        self._i2c_cache = found
+        self._i2c_cache_time = time.monotonic()
+        return found
+
+    def _scan_blocking(self):
+        """Probe every 7-bit address; runs on the I2C worker thread."""
         found = {}
-        known_addrs = {
-            0x68: "MPU6050",
-            0x57: "MAX30102",
-            0x76: "BME280",
-            0x77: "BME280-alt",
-            0x5A: "MLX90614",
-            0x23: "BH1750",
-        }
 
         for addr in range(0x03, 0x78):
             try:
                 self._bus.read_byte(addr)
-                name = known_addrs.get(addr, f"Unknown-0x{addr:02x}")
-                found[addr] = name
-                log.info(f"I2C device found: {name} at 0x{addr:02x}")
             except Exception:
-                pass
+                continue
+            found[addr] = KNOWN_I2C_ADDRS.get(addr, f"Unknown-0x{addr:02x}")
 
         return found
 
+    async def _bus_read_byte(self, addr):
+        """read_byte() on the I2C worker thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_exec, self._bus.read_byte, addr)
+
+    @property
+    def names(self):
+        """Registered sensor names, in registration order."""
+        return tuple(self._names)
+
     def register(self, name, read_fn=None, interval=1.0, i2c_addr=None):
         """Register a sensor for polling."""
-        self.sensors[name] = {
-            "name": name,
-            "status": "pending",
-            "value": "—",
-            "read_fn": read_fn,
-            "interval": interval,
-            "i2c_addr": i2c_addr,
-            "last_read": 0,
-            "error_count": 0,
-        }
+        i = self._idx.get(name)
+        if i is None:
+            i = self._idx[name] = len(self._names)
+            self._names.append(name)
+            for col in (self._status, self._value, self._read_fn, self._interval,
+                        self._addr, self._last_read, self._err, self._unchanged,
+                        self._emitted):
+                col.append(None)
+
+        self._set_state(i, PENDING, "—")
+        self._read_fn[i] = read_fn
+        self._interval[i] = interval
+        self._addr[i] = i2c_addr
+        self._last_read[i] = 0
+        self._err[i] = 0
+        self._unchanged[i] = 0
+        self._emitted[i] = PENDING
         log.info(f"Registered sensor: {name}" +
                  (f" at I2C 0x{i2c_addr:02x}" if i2c_addr else ""))
 
+    def set_status(self, name, status):
+        """Force a sensor's status ("pending", "connected", "offline")."""
+        self._set_state(self._idx[name], STATUS_NAMES.index(status))
+
+    def set_all_status(self, status):
+        """Force every registered sensor to the same status."""
+        self._status[:] = [STATUS_NAMES.index(status)] * len(self._status)
+        self._gen += 1
+
+    def _set_state(self, i, status, value=None):
+        """Update sensor i's status (and value) and invalidate the readings cache."""
+        self._status[i] = status
+        if value is not None:
+            self._value[i] = value
+        self._gen += 1
+
     async def probe(self, name):
         """Check if a sensor is connected."""
-        sensor = self.sensors.get(name)
-        if not sensor:
+        i = self._idx.get(name)
+        if i is None:
             return False
 
-        if sensor["i2c_addr"] and self._bus:
+        addr = self._addr[i]
+        if addr and self._bus:
+            # A recent scan already knows whether the device is there
+            if (self._i2c_cache is not None and
+                    time.monotonic() - self._i2c_cache_time < I2C_SCAN_TTL):
+                if addr in self._i2c_cache:
+                    self._set_state(i, CONNECTED)
+                    return True
+                self._set_state(i, OFFLINE)
+                return False
+
             try:
-                self._bus.read_byte(sensor["i2c_addr"])
-                sensor["status"] = "connected"
-                log.info(f"{name}: connected at 0x{sensor['i2c_addr']:02x}")
+                await self._bus_read_byte(addr)
+                self._set_state(i, CONNECTED)
+                log.info(f"{name}: connected at 0x{addr:02x}")
                 return True
             except Exception:
-                sensor["status"] = "offline"
+                self._set_state(i, OFFLINE)
                 return False
 
-        if sensor["read_fn"]:
+        if self._read_fn[i]:
             try:
-                val = await sensor["read_fn"]()
-                sensor["status"] = "connected"
-                sensor["value"] = str(val)
+                val = await self._read_fn[i]()
+                self._set_state(i, CONNECTED, str(val))
                 return True
             except Exception:
-                sensor["status"] = "offline"
+                self._set_state(i, OFFLINE)
                 return False
 
         return False
 
-    async def poll_sensor(self, name):
-        """Continuously read a sensor at its interval."""
-        sensor = self.sensors[name]
-        while True:
-            if sensor["status"] == "connected" and sensor["read_fn"]:
-                try:
-                    val = await sensor["read_fn"]()
-                    sensor["value"] = str(val)
-                    sensor["error_count"] = 0
-                    for cb in self.callbacks:
-                        try:
-                            await cb(name, sensor["status"], sensor["value"])
-                        except Exception as e:
-                            log.error(f"Callback error: {e}")
-                except Exception as e:
-                    sensor["error_count"] += 1
-                    if sensor["error_count"] > 5:
-                        sensor["status"] = "offline"
-                        sensor["value"] = "ERR"
-                        log.error(f"{name}: too many errors, marking offline")
-                    else:
-                        log.debug(f"{name} read error: {e}")
-
-            elif sensor["status"] == "offline":
-                # Periodically retry offline sensors
-                await self.probe(name)
-
-            await asyncio.sleep(sensor["interval"])
+    async def _poll_once(self, i):
+        """Read sensor i once (or re-probe it if offline) and notify."""
+        name = self._names[i]
+        status = self._status[i]
+        if status == CONNECTED and self._read_fn[i]:
+            try:
+                val = await asyncio.wait_for(self._read_fn[i](), READ_TIMEOUT)
+                value = str(val)
+                self._err[i] = 0
+                self._last_read[i] = time.monotonic()
+            except Exception as e:
+                self._err[i] += 1
+                if self._err[i] > 5:
+                    self._set_state(i, OFFLINE, "ERR")
+                    log.error(f"{name}: too many errors, marking offline")
+                    self._emitted[i] = OFFLINE
+                    self._emit(name, "offline", "ERR")
+                else:
+                    log.debug(f"{name} read error: {e!r}")
+            else:
+                # Skip callbacks when nothing changed since the last
+                # "connected" update, but re-send periodically. After a
+                # recovery probe() has already stored the value, so the
+                # first poll must still announce the status change.
+                if (value == self._value[i] and self._emitted[i] == CONNECTED
+                        and self._unchanged[i] < FORCE_EMIT_EVERY):
+                    self._unchanged[i] += 1
+                    return
+                self._set_state(i, CONNECTED, value)
+                self._unchanged[i] = 0
+                self._emitted[i] = CONNECTED
+                self._emit(name, "connected", value)
+
+        elif status == OFFLINE:
+            # Periodically retry offline sensors
+            await self.probe(name)
+
+    async def _scheduler(self):
+        """
+        Poll every sensor at its own interval from a single task.
+        A heap of (deadline, interval, index) gives the next sensor due;
+        on equal deadlines the faster sensor wins (shortest job first),
+        so e.g. a 100ms motion tick is never queued behind a 10s BME280.
+        Each poll runs as its own task so a slow read never delays the
+        others; if a sensor's previous poll is still running, that tick
+        is skipped.
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        intervals = self._interval
+        heap = [(now, intervals[i], i) for i, fn in enumerate(self._read_fn) if fn]
+        heapq.heapify(heap)
+
+        while heap:
+            deadline, interval, i = heap[0]
+            delay = deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            # Keep phase, but don't burst to catch up after a stall
+            now = loop.time()
+            next_deadline = deadline + interval
+            if next_deadline < now:
+                next_deadline = now + interval
+            heapq.heapreplace(heap, (next_deadline, interval, i))
+
+            if i in self._pending:
+                continue
+            task = asyncio.create_task(self._poll_once(i))
+            self._pending[i] = task
+            task.add_done_callback(lambda _t, i=i: self._pending.pop(i, None))
 
     async def start_all(self):
         """Probe all sensors and start polling connected ones."""
-        for name in list(self.sensors.keys()):
-            await self.probe(name)
+        # Probe concurrently, fastest-polling sensors first, so the
+        # first motion sample isn't held up behind slow sensors
+        ordered = sorted(self._names, key=lambda n: self._interval[self._idx[n]])
+        await asyncio.gather(*(self.probe(n) for n in ordered))
 
         # Notify display of initial states
-        for name, sensor in self.sensors.items():
-            for cb in self.callbacks:
-                try:
-                    await cb(name, sensor["status"], sensor["value"])
-                except Exception:
-                    pass
-
-        # Start polling tasks
-        tasks = []
-        for name, sensor in self.sensors.items():
-            if sensor["read_fn"]:
-                task = asyncio.create_task(self.poll_sensor(name))
-                tasks.append(task)
-                log.info(f"Polling {name} every {sensor['interval']}s")
-
-        self._tasks = tasks
-        return tasks
+        for name, status, value in zip(self._names, self._status, self._value):
+            await self._notify(name, STATUS_NAMES[status], value)
+        self._emitted[:] = self._status
+
+        # Start the polling scheduler
+        for name, fn, interval in zip(self._names, self._read_fn, self._interval):
+            if fn:
+                log.info(f"Polling {name} every {interval}s")
+
+        self._tasks = [
+            asyncio.create_task(self._dispatch_loop()),
+            asyncio.create_task(self._scheduler()),
+        ]
+        return self._tasks
 
     def get_reading(self, name):
         """Get latest reading for a sensor."""
-        sensor = self.sensors.get(name)
-        if sensor:
-            return sensor["value"]
+        i = self._idx.get(name)
+        if i is not None:
+            return self._value[i]
         return None
 
     def get_status(self, name):
         """Get sensor status."""
-        sensor = self.sensors.get(name)
-        if sensor:
-            return sensor["status"]
+        i = self._idx.get(name)
+        if i is not None:
+            return STATUS_NAMES[self._status[i]]
         return "unknown"
 
     def get_all_readings(self):
-        """Get dict of all sensor readings."""
-        return {
-            name: {"status": s["status"], "value": s["value"]}
-            for name, s in self.sensors.items()
+        """
+        Get dict of all sensor readings.
+        The dict is cached until a status or value changes, so callers
+        must treat it as read-only.
+        """
+        readings, gen = self._readings_cache
+        if gen == self._gen:
+            return readings
+        readings = {
+            name: {"status": STATUS_NAMES[s], "value": v}
+            for name, s, v in zip(self._names, self._status, self._value)
         }
+        self._readings_cache = (readings, self._gen)
+        return readings
 
     def cleanup(self):
         """Release I2C bus and cancel tasks."""
         for task in self._tasks:
             task.cancel()
+        for task in list(self._pending.values()):
+            task.cancel()
+        # Wait for any transfer already on the worker (at most one) so the
+        # bus isn't closed under it; queued ones are dropped
+        self._io_exec.shutdown(wait=True, cancel_futures=True)
         if self._bus:
             self._bus.close()
         log.info("Sensor hub shut down")
@@ -205,33 +421,53 @@ class SensorHub:
 class DemoSensors:
     """Generate realistic fake sensor data for testing."""
 
+    NOISE_LEN = 1024    # power of two, so the ring index can wrap with &
+
     def __init__(self, hub):
         self.hub = hub
         self._hr = 72
         self._temp = 36.5
         self._room = 21.5
         self._hum = 52
+        self._noise_buf = self._make_noise(self.NOISE_LEN)
+        self._noise_i = 0
+
+    @staticmethod
+    def _make_noise(n):
+        """n uniform samples in [-1, 1), drawn in one batch via numpy if present."""
+        try:
+            import numpy as np
+            return np.random.default_rng().uniform(-1.0, 1.0, n).tolist()
+        except ImportError:
+            import random
+            return [random.uniform(-1.0, 1.0) for _ in range(n)]
+
+    def _noise(self):
+        """Next sample from the noise ring buffer."""
+        i = self._noise_i
+        self._noise_i = (i + 1) & (self.NOISE_LEN - 1)
+        return self._noise_buf[i]
 
     def register_all(self):
         """Register all demo sensors."""
-        import random
 
         async def fake_heart_rate():
-            self._hr += random.uniform(-2, 2)
+            self._hr += 2 * self._noise()
             self._hr = max(58, min(95, self._hr))
             return f"{int(self._hr)} bpm"
 
         async def fake_body_temp():
-            self._temp += random.uniform(-0.05, 0.05)
+            self._temp += 0.05 * self._noise()
             self._temp = max(36.0, min(37.2, self._temp))
             return f"{self._temp:.1f}°C"
 
         async def fake_room():
-            self._room += random.uniform(-0.1, 0.1)
+            self._room += 0.1 * self._noise()
             return f"{self._room:.1f}°C {int(self._hum)}%"
 
         async def fake_motion():
-            return "Active" if random.random() > 0.3 else "Still"
+            # Same 70% "Active" odds as random() > 0.3
+            return "Active" if self._noise() > -0.4 else "Still"
 
         self.hub.register("MAX30102", read_fn=fake_heart_rate, interval=2.0)
         self.hub.register("MLX90614", read_fn=fake_body_temp, interval=5.0)
@@ -239,7 +475,6 @@ class DemoSensors:
         self.hub.register("MPU6050", read_fn=fake_motion, interval=1.0)
 
         # Set all as "connected" in demo mode
-        for name in self.hub.sensors:
-            self.hub.sensors[name]["status"] = "connected"
+        self.hub.set_all_status("connected")
 
         log.info("Demo sensors registered (4 simulated)")
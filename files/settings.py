@@ -4,6 +4,13 @@
 
 import json
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 BASE_DIR = Path(__file__).parent.parent
 
@@ -13,6 +20,7 @@ CONFIG = {
         "width": 480,
         "height": 320,
         "fps": 30,
+        "idle_fps": 4,               # when nothing is animating
         "driver": "fbcp",            # framebuffer copy (SPI LCD)
         "spi_speed": 32000000,       # 32MHz SPI clock
         "backlight_pin": 18,         # GPIO for backlight control
@@ -59,6 +67,7 @@ CONFIG = {
 
     # ─── Sensors (future) ─────────────────────────────────
     "sensors": {
+        "display_min_period_ms": 50,  # coalesce faster per-sensor updates
         "mpu6050": {"enabled": False, "i2c_addr": 0x68, "poll_hz": 10},
         "max30102": {"enabled": False, "i2c_addr": 0x57, "poll_hz": 1},
         "bme280": {"enabled": False, "i2c_addr": 0x76, "poll_hz": 0.1},
@@ -120,22 +129,52 @@ def save_config(filepath=None):
         json.dump(CONFIG, f, indent=2)
 
 
+# (path, mtime_ns) of the settings file last merged into CONFIG
+_load_config_cache = (None, None)
+
+
 def load_config(filepath=None):
-    """Load config from JSON file, merging with defaults."""
+    """
+    Load config from JSON file, merging with defaults.
+    Unchanged files (same mtime) are not re-read, so repeat
+    calls cost a single stat().
+    """
+    global _load_config_cache
     if filepath is None:
         filepath = BASE_DIR / "config" / "settings.json"
     filepath = Path(filepath)
-    if filepath.exists():
-        with open(filepath) as f:
-            user_config = json.load(f)
-        _deep_merge(CONFIG, user_config)
+    try:
+        mtime = filepath.stat().st_mtime_ns
+    except FileNotFoundError:
+        return CONFIG
+    if _load_config_cache == (filepath, mtime):
+        return CONFIG
+    user_config = _loads(filepath.read_bytes())
+    _deep_merge(CONFIG, user_config)
+    _load_config_cache = (filepath, mtime)
     return CONFIG
 
 
+def freeze(obj):
+    """
+    Read-only view of a config tree: dicts become MappingProxyType,
+    lists become tuples. Subsystems get frozen sections so they can't
+    mutate the shared CONFIG by accident; .get() and [] still work.
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({k: freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(freeze(v) for v in obj)
+    return obj
+
+
 def _deep_merge(base, override):
-    """Recursively merge override into base dict."""
-    for key, value in override.items():
-        if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-            _deep_merge(base[key], value)
-        else:
-            base[key] = value
+    """Merge override into base dict, descending into nested dicts."""
+    stack = [(base, override)]
+    while stack:
+        base, override = stack.pop()
+        for key, value in override.items():
+            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
+                stack.append((base[key], value))
+            else:
+                base[key] = value
@@ -6,7 +6,8 @@ Tests each hardware component individually.
 Run this first to verify everything is working.
 
 Usage:
-  python3 test_hardware.py          # Run all tests
+  python3 test_hardware.py          # Run all tests, one by one
+  python3 test_hardware.py --parallel  # Run all, non-interactive ones concurrently
   python3 test_hardware.py lcd      # Test LCD only
   python3 test_hardware.py mic      # Test microphone only
   python3 test_hardware.py speaker  # Test speaker only
@@ -15,32 +16,131 @@ Usage:
   python3 test_hardware.py i2c      # Scan I2C bus
 """
 
+import re
 import sys
 import os
 import time
+import wave
+import asyncio
 import subprocess
+import contextvars
+from datetime import timedelta
+
+try:
+    from modules.voice import cached_which
+except ImportError:
+    from shutil import which as cached_which
 
 GREEN = "\033[92m"
 RED = "\033[91m"
 YELLOW = "\033[93m"
 RESET = "\033[0m"
 
+# When set, test output is collected here instead of printed, so tests
+# running concurrently don't interleave their lines
+_output = contextvars.ContextVar("output", default=None)
+
+def out(msg=""):
+    buf = _output.get()
+    if buf is None:
+        print(msg)
+    else:
+        buf.append(msg)
+
 def ok(msg):
-    print(f"  {GREEN}✓{RESET} {msg}")
+    out(f"  {GREEN}✓{RESET} {msg}")
 
 def fail(msg):
-    print(f"  {RED}✗{RESET} {msg}")
+    out(f"  {RED}✗{RESET} {msg}")
 
 def warn(msg):
-    print(f"  {YELLOW}⚠{RESET} {msg}")
+    out(f"  {YELLOW}⚠{RESET} {msg}")
 
 def header(title):
-    print(f"\n{'─'*50}")
-    print(f"  {title}")
-    print(f"{'─'*50}")
+    out(f"\n{'─'*50}")
+    out(f"  {title}")
+    out(f"{'─'*50}")
+
+
+# Device-listing commands, all run from one shell by discover()
+DISCOVERY_CMDS = {
+    "arecord": "arecord -l",
+    "aplay": "aplay -l",
+    "i2cdetect": "i2cdetect -y 1",
+}
+DISCOVERY_SEP = "---MAYA-SEP---"
+_discovery = None   # tool -> (returncode, stdout)
+
+
+def discover(tool):
+    """
+    stdout of a DISCOVERY_CMDS entry. The first call runs all of them
+    in a single bash process (one fork instead of one per command) and
+    the results are reused for the rest of the run. Raises
+    FileNotFoundError if the tool isn't installed, like subprocess.run.
+    """
+    global _discovery
+    if _discovery is None:
+        script = "".join(
+            f"{cmd} 2>/dev/null; echo {DISCOVERY_SEP} $?\n"
+            for cmd in DISCOVERY_CMDS.values()
+        )
+        out = subprocess.run(
+            ["bash", "-c", script], stdin=subprocess.DEVNULL,
+            capture_output=True, text=True, timeout=8,
+        ).stdout
+        sections = re.findall(rf"(.*?){DISCOVERY_SEP} (\d+)\n", out, re.S)
+        _discovery = {
+            tool: (int(rc), text)
+            for tool, (text, rc) in zip(DISCOVERY_CMDS, sections)
+        }
+
+    rc, text = _discovery[tool]
+    if rc == 127:
+        raise FileNotFoundError(f"{tool}: command not found")
+    return text
+
+
+def spawn_wait(args, timeout=10):
+    """
+    Run a command (absolute path in args[0]) and wait for it, killing
+    it after `timeout` seconds. With close_fds=False and a full path
+    CPython can use posix_spawn instead of fork + closing every fd.
+    """
+    proc = subprocess.Popen(args, close_fds=False)
+    try:
+        return proc.wait(timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+
 
+def read_kernel_log():
+    """
+    Kernel ring buffer as bytes. Reads /dev/kmsg directly (one record
+    per read) and only spawns dmesg if that isn't readable.
+    """
+    try:
+        fd = os.open("/dev/kmsg", os.O_RDONLY | os.O_NONBLOCK)
+    except OSError:
+        return subprocess.run(["dmesg"], capture_output=True, timeout=5).stdout
 
-def test_lcd():
+    records = []
+    try:
+        while True:
+            try:
+                records.append(os.read(fd, 8192))
+            except BlockingIOError:
+                break           # caught up with the buffer
+            except BrokenPipeError:
+                continue        # record overwritten while reading; skip it
+    finally:
+        os.close(fd)
+    return b"".join(records)
+
+
+async def test_lcd():
     """Test the 3.5" LCD display."""
     header("🖥  LCD Display Test")
 
@@ -51,17 +151,17 @@ def test_lcd():
         else:
             warn(f"No framebuffer at {fb}")
 
-    # Check if LCD driver is loaded
-    try:
-        result = subprocess.run(
-            ["dmesg"], capture_output=True, text=True, timeout=5
-        )
-        if "ili9486" in result.stdout.lower() or "fb_ili9486" in result.stdout.lower():
-            ok("ILI9486 LCD driver loaded")
-        else:
-            warn("ILI9486 driver not detected in dmesg")
-    except Exception:
-        warn("Could not check dmesg")
+    # Check if LCD driver is loaded — /dev/fb1 only appears once it is
+    if os.path.exists("/dev/fb1"):
+        ok("LCD driver loaded (/dev/fb1 present)")
+    else:
+        try:
+            if b"ili9486" in read_kernel_log().lower():
+                ok("ILI9486 LCD driver loaded")
+            else:
+                warn("ILI9486 driver not detected in kernel log")
+        except Exception:
+            warn("Could not check kernel log")
 
     # Try pygame
     try:
@@ -82,7 +182,7 @@ def test_lcd():
         for color, name in colors:
             screen.fill(color)
             pygame.display.flip()
-            time.sleep(0.5)
+            await asyncio.sleep(0.5)
         screen.fill((0, 0, 0))
         pygame.display.flip()
         pygame.quit()
@@ -92,20 +192,18 @@ def test_lcd():
         warn("Make sure LCD driver is installed (cd ~/LCD-show && sudo ./LCD35B-show)")
 
 
-def test_microphone():
+async def test_microphone():
     """Test the ReSpeaker 2-Mic HAT microphone."""
     header("🎤  Microphone Test")
 
     # Check ALSA devices
     try:
-        result = subprocess.run(
-            ["arecord", "-l"], capture_output=True, text=True, timeout=5
-        )
-        if "seeed" in result.stdout.lower() or "wm8960" in result.stdout.lower():
+        devices = discover("arecord")
+        if "seeed" in devices.lower() or "wm8960" in devices.lower():
             ok("ReSpeaker audio device found")
-            for line in result.stdout.strip().split("\n"):
+            for line in devices.strip().split("\n"):
                 if "card" in line.lower():
-                    print(f"    {line.strip()}")
+                    out(f"    {line.strip()}")
         else:
             fail("ReSpeaker not in arecord -l output")
             warn("Install driver: cd ~/seeed-voicecard && sudo ./install.sh")
@@ -114,37 +212,47 @@ def test_microphone():
         fail(f"arecord failed: {e}")
         return
 
-    # Record test
-    print("\n  Recording 3 seconds... speak now!")
+    # Record test — straight from PortAudio, the same path the assistant uses
+    try:
+        import numpy as np
+        import sounddevice as sd
+    except ImportError:
+        fail("sounddevice not installed: pip install sounddevice numpy")
+        return
+
+    out("\n  Recording 3 seconds... speak now!")
     test_file = "/tmp/test_mic.wav"
     try:
-        subprocess.run(
-            ["arecord", "-D", "plughw:seeed2micvoicec,0",
-             "-f", "S16_LE", "-r", "16000", "-c", "1",
-             "-d", "3", "-t", "wav", test_file],
-            timeout=10, capture_output=True
+        device = next(
+            (i for i, dev in enumerate(sd.query_devices())
+             if "seeed2micvoicec" in dev["name"] and dev["max_input_channels"] > 0),
+            None,
         )
-        size = os.path.getsize(test_file)
-        if size > 1000:
-            ok(f"Recorded {size} bytes to {test_file}")
-            print(f"    Play with: aplay {test_file}")
+        data = sd.rec(3 * 16000, samplerate=16000, channels=1,
+                      dtype="int16", device=device)
+        await asyncio.to_thread(sd.wait)
+        level = np.abs(data.astype(np.int32)).mean()
+        if level > 1:
+            ok(f"Recorded 3s, mean level {level:.0f}")
+            with wave.open(test_file, "wb") as wav:
+                wav.setnchannels(1)
+                wav.setsampwidth(2)
+                wav.setframerate(16000)
+                wav.writeframes(data.tobytes())
+            out(f"    Play with: aplay {test_file}")
         else:
-            fail("Recording too small — check microphone")
-    except subprocess.TimeoutExpired:
-        fail("Recording timed out")
+            fail("Recording is silent — check microphone")
     except Exception as e:
         fail(f"Recording failed: {e}")
 
 
-def test_speaker():
+async def test_speaker():
     """Test speaker/headphone output."""
     header("🔊  Speaker Test")
 
     try:
-        result = subprocess.run(
-            ["aplay", "-l"], capture_output=True, text=True, timeout=5
-        )
-        if "seeed" in result.stdout.lower() or "wm8960" in result.stdout.lower():
+        devices = discover("aplay")
+        if "seeed" in devices.lower() or "wm8960" in devices.lower():
             ok("ReSpeaker playback device found")
         else:
             warn("ReSpeaker not in aplay -l")
@@ -152,35 +260,58 @@ def test_speaker():
         pass
 
     # TTS test
-    import shutil
-    if shutil.which("espeak-ng"):
-        print("  Speaking test phrase...")
+    if espeak_ng := cached_which("espeak-ng"):
+        out("  Speaking test phrase...")
         try:
-            subprocess.run(
-                ["espeak-ng", "-s", "140", "Hello! The Maya is working."],
-                timeout=10
+            await asyncio.to_thread(
+                spawn_wait, [espeak_ng, "-s", "140", "Hello! The Maya is working."]
             )
             ok("espeak-ng TTS working")
         except Exception as e:
             fail(f"espeak-ng failed: {e}")
-    elif shutil.which("espeak"):
-        print("  Speaking test phrase...")
-        subprocess.run(["espeak", "Hello! The Maya is working."], timeout=10)
+    elif espeak := cached_which("espeak"):
+        out("  Speaking test phrase...")
+        await asyncio.to_thread(spawn_wait, [espeak, "Hello! The Maya is working."])
         ok("espeak TTS working")
     else:
         fail("No TTS engine (install espeak-ng)")
 
 
-def test_button():
+async def test_button():
     """Test the on-board button on GPIO 17."""
     header("🔘  Button Test (GPIO 17)")
 
+    # Prefer kernel edge events (libgpiod v2): no polling while waiting
+    try:
+        import gpiod
+        from gpiod.line import Bias, Direction, Edge
+    except ImportError:
+        gpiod = None
+    if gpiod:
+        try:
+            settings = gpiod.LineSettings(
+                direction=Direction.INPUT, bias=Bias.PULL_UP,
+                edge_detection=Edge.FALLING,
+            )
+            with gpiod.request_lines("/dev/gpiochip0", consumer="maya-test",
+                                     config={17: settings}) as request:
+                out("  Press the button on the ReSpeaker HAT (10 second timeout)...")
+                if await asyncio.to_thread(
+                    request.wait_edge_events, timedelta(seconds=10)
+                ):
+                    ok("Button press detected!")
+                else:
+                    warn("No button press detected within 10 seconds")
+            return
+        except Exception as e:
+            warn(f"gpiod failed ({e}), trying RPi.GPIO")
+
     try:
         import RPi.GPIO as GPIO
         GPIO.setmode(GPIO.BCM)
         GPIO.setup(17, GPIO.IN, pull_up_down=GPIO.PUD_UP)
 
-        print("  Press the button on the ReSpeaker HAT (10 second timeout)...")
+        out("  Press the button on the ReSpeaker HAT (10 second timeout)...")
         start = time.time()
         pressed = False
         while time.time() - start < 10:
@@ -188,7 +319,7 @@ def test_button():
                 ok("Button press detected!")
                 pressed = True
                 break
-            time.sleep(0.05)
+            await asyncio.sleep(0.05)
 
         if not pressed:
             warn("No button press detected within 10 seconds")
@@ -200,7 +331,7 @@ def test_button():
         fail(f"Button test failed: {e}")
 
 
-def test_leds():
+async def test_leds():
     """Test the 3 APA102 LEDs on the ReSpeaker HAT."""
     header("💡  APA102 LED Test")
 
@@ -219,8 +350,8 @@ def test_leds():
             for i in range(3):
                 strip.set_pixel(i, r, g, b)
             strip.show()
-            print(f"    LEDs: {name}")
-            time.sleep(0.5)
+            out(f"    LEDs: {name}")
+            await asyncio.sleep(0.5)
 
         strip.clear_strip()
         ok("LED test complete")
@@ -231,16 +362,13 @@ def test_leds():
         warn("LEDs may conflict with SPI LCD — this is expected")
 
 
-def test_i2c():
+async def test_i2c():
     """Scan the I2C bus for connected sensors."""
     header("🔌  I2C Bus Scan")
 
     try:
-        result = subprocess.run(
-            ["i2cdetect", "-y", "1"],
-            capture_output=True, text=True, timeout=5
-        )
-        print(result.stdout)
+        table = discover("i2cdetect")
+        out(table)
 
         known = {
             "68": "MPU6050 (accel/gyro)",
@@ -253,7 +381,7 @@ def test_i2c():
         }
 
         for addr, name in known.items():
-            if addr in result.stdout:
+            if addr in table:
                 ok(f"Found {name} at 0x{addr}")
 
     except FileNotFoundError:
@@ -263,30 +391,87 @@ def test_i2c():
 
 
 # ─── Main ───────────────────────────────────────────────────
-if __name__ == "__main__":
-    tests = {
-        "lcd": test_lcd,
-        "mic": test_microphone,
-        "speaker": test_speaker,
-        "button": test_button,
-        "leds": test_leds,
-        "i2c": test_i2c,
+TESTS = {
+    "lcd": test_lcd,
+    "mic": test_microphone,
+    "speaker": test_speaker,
+    "button": test_button,
+    "leds": test_leds,
+    "i2c": test_i2c,
+}
+INTERACTIVE = ("mic", "button")     # need the user; run one at a time, live
+SPI_TESTS = {"lcd", "leds"}         # share the SPI bus; never overlap
+AUDIO_TESTS = {"mic", "speaker"}    # speaker output would leak into the recording
+
+
+async def run_all(parallel=False):
+    """
+    Run every test. Serially by default; with `parallel` the interactive
+    ones run first, one by one, with their prompts shown live, while the
+    rest run concurrently in the background and their buffered output is
+    printed afterwards, in order.
+    """
+    if not parallel:
+        for name, test_fn in TESTS.items():
+            try:
+                await test_fn()
+            except Exception as e:
+                fail(f"{name} test crashed: {e}")
+        return
+
+    spi_lock = asyncio.Lock()
+    audio_lock = asyncio.Lock()
+
+    async def exclusive(name):
+        if name in SPI_TESTS:
+            async with spi_lock:
+                await TESTS[name]()
+        elif name in AUDIO_TESTS:
+            async with audio_lock:
+                await TESTS[name]()
+        else:
+            await TESTS[name]()
+
+    async def buffered(name):
+        lines = []
+        _output.set(lines)      # task-local: each task has its own context
+        try:
+            await exclusive(name)
+        except Exception as e:
+            fail(f"{name} test crashed: {e}")
+        return lines
+
+    background = {
+        name: asyncio.create_task(buffered(name))
+        for name in TESTS if name not in INTERACTIVE
     }
+    # Background tasks haven't started yet, so the first interactive test
+    # takes its lock before any of them can
+    for name in INTERACTIVE:
+        await exclusive(name)
+    for name, task in background.items():
+        for line in await task:
+            print(line)
+
 
+if __name__ == "__main__":
     print(f"\n{'='*50}")
     print("  🔧 Hardware Test Suite")
     print(f"{'='*50}")
 
-    if len(sys.argv) > 1:
-        name = sys.argv[1].lower()
-        if name in tests:
-            tests[name]()
+    args = sys.argv[1:]
+    parallel = "--parallel" in args
+    args = [a for a in args if a != "--parallel"]
+
+    if args:
+        name = args[0].lower()
+        if name in TESTS:
+            asyncio.run(TESTS[name]())
         else:
             print(f"Unknown test: {name}")
-            print(f"Available: {', '.join(tests.keys())}")
+            print(f"Available: {', '.join(TESTS.keys())}")
     else:
-        for test_fn in tests.values():
-            test_fn()
+        asyncio.run(run_all(parallel))
 
     print(f"\n{'='*50}")
     print("  Done!")
@@ -14,19 +14,41 @@ All processing is offline for privacy.
 """
 
 import os
+import re
 import sys
 import json
 import time
+import shutil
 import wave
 import struct
 import logging
+import queue
 import asyncio
 import threading
 from pathlib import Path
-from datetime import datetime
+from datetime import timedelta
 
 log = logging.getLogger("Voice")
 
+# orjson parses Vosk's result JSON several times faster; fall back to stdlib
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Optional: Aho–Corasick automaton for command keyword matching
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: python-alsaaudio, to keep one playback PCM open across utterances
+try:
+    import alsaaudio
+except ImportError:
+    alsaaudio = None
+
 # LED patterns for the 3 APA102 LEDs on the ReSpeaker HAT
 LED_PATTERNS = {
     "idle":      [(0, 0, 10)] * 3,        # dim blue
@@ -37,67 +59,194 @@ LED_PATTERNS = {
     "off":       [(0, 0, 0)] * 3,
 }
 
+# Resolved executable paths, shared by the TTS setup and test_hardware.py.
+# Hits are also persisted so the next launch can skip the PATH walk.
+WHICH_CACHE_FILE = (Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser()
+                    / "maya" / "which.json")
+WHICH_CACHE_TTL = 24 * 3600
+_which_cache = {}       # name -> path or None, for this process
+_which_disk = None      # entries loaded from WHICH_CACHE_FILE
+
+# sd.query_devices() makes PortAudio rescan ALSA (100-300 ms on a Pi, and
+# it opens/closes the WM8960); keep the list until PortAudio errors out
+_device_cache = None
+
+# A wedged ALSA device (seen on the WM8960) can hang a TTS child forever;
+# allow roughly 10 chars/second of speech with this floor before killing it
+TTS_MIN_TIMEOUT = 5.0
+# Budget for loading the Vosk model from a slow SD card
+MODEL_LOAD_TIMEOUT = 120.0
+
+# espeak-ng --stdout and piper --output-raw both produce 22.05 kHz mono S16_LE
+TTS_RATE = 22050
+WAV_HEADER_LEN = 44     # espeak-ng --stdout prefixes a canonical WAV header
+
+# GPIO character device for the button (libgpiod), and the minimum
+# spacing between presses, matching RPi.GPIO's bouncetime=300
+GPIO_CHIP = "/dev/gpiochip0"
+BUTTON_BOUNCE_NS = 300_000_000
+
+# Reply to "good morning/afternoon/evening", indexed by the current hour
+GREETINGS = (
+    ("Good morning! Did you sleep well?",) * 12
+    + ("Good afternoon! Having a nice day?",) * 5
+    + ("Good evening! How was your day?",) * 7
+)
+
+
+def cached_which(name):
+    """
+    shutil.which() with caching. Looks in memory, then in
+    WHICH_CACHE_FILE (if under a day old and the path is still
+    executable), then walks PATH and records any hit.
+    """
+    global _which_disk
+    if name in _which_cache:
+        return _which_cache[name]
+
+    if _which_disk is None:
+        _which_disk = {}
+        try:
+            if time.time() - WHICH_CACHE_FILE.stat().st_mtime < WHICH_CACHE_TTL:
+                _which_disk = json.loads(WHICH_CACHE_FILE.read_text())
+        except (OSError, ValueError):
+            pass
+
+    path = _which_disk.get(name)
+    if not (path and os.access(path, os.X_OK)):
+        path = shutil.which(name)
+        if path:
+            _which_disk[name] = path
+            try:
+                WHICH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                WHICH_CACHE_FILE.write_text(json.dumps(_which_disk))
+            except OSError as e:
+                log.debug(f"Could not write {WHICH_CACHE_FILE}: {e}")
+
+    _which_cache[name] = path
+    return path
+
 
 class LEDController:
-    """Controls the 3 APA102 RGB LEDs on the ReSpeaker HAT."""
+    """
+    Controls the 3 APA102 RGB LEDs on the ReSpeaker HAT.
+    SPI writes happen on a background thread; a request that hasn't
+    been shown yet is replaced by a newer one, so callers never block.
+    Each request is one complete SPI frame; frames for LED_PATTERNS
+    are encoded once in init().
+    """
 
     def __init__(self):
         self.pixels = None
         self.enabled = False
+        self._pending = queue.Queue(maxsize=1)  # latest frame, None = stop
+        self._thread = None
+        self._frames = {}   # pattern name -> encoded SPI frame
 
     def init(self):
         """Initialize APA102 LED strip."""
         try:
             from apa102_pi.driver import apa102
             self.pixels = apa102.APA102(num_led=3, global_brightness=10)
+            self._frames = {
+                name: self._encode_frame(colors)
+                for name, colors in LED_PATTERNS.items()
+            }
             self.enabled = True
+            self._thread = threading.Thread(
+                target=self._worker, name="leds", daemon=True
+            )
+            self._thread.start()
             log.info("APA102 LEDs initialized (3 LEDs)")
         except ImportError:
             log.warning("apa102-pi not installed — LEDs disabled")
         except Exception as e:
             log.warning(f"LED init failed: {e}")
 
+    def _encode_frame(self, colors):
+        """
+        The bytes APA102.show() would send for these (r, g, b) colours,
+        as one buffer: start frame, one 4-byte frame per LED in the
+        strip's colour order, then the end/reset frame.
+        """
+        px = self.pixels
+        frame = bytearray(4)
+        for r, g, b in colors:
+            led = [px.LED_START | (px.global_brightness & 0b11111), 0, 0, 0]
+            led[px.rgb[0]], led[px.rgb[1]], led[px.rgb[2]] = r, g, b
+            frame += bytes(led)
+        frame += bytes(4 + (px.num_led + 15) // 16)
+        return bytes(frame)
+
+    def _submit(self, frame):
+        """Queue a frame for the worker, dropping any request not yet shown."""
+        try:
+            self._pending.get_nowait()
+        except queue.Empty:
+            pass
+        self._pending.put_nowait(frame)
+
+    def _worker(self):
+        """Write requested frames to the strip until told to stop."""
+        while (frame := self._pending.get()) is not None:
+            try:
+                self.pixels.send_to_spi(frame)
+            except Exception as e:
+                log.warning(f"LED update failed: {e}")
+
     def set_pattern(self, pattern_name):
         """Set LED pattern by name."""
         if not self.enabled or not self.pixels:
             return
-        pattern = LED_PATTERNS.get(pattern_name, LED_PATTERNS["off"])
-        for i, (r, g, b) in enumerate(pattern):
-            self.pixels.set_pixel(i, r, g, b)
-        self.pixels.show()
+        self._submit(self._frames.get(pattern_name, self._frames["off"]))
 
     def set_color(self, r, g, b):
         """Set all LEDs to same color."""
         if not self.enabled or not self.pixels:
             return
-        for i in range(3):
-            self.pixels.set_pixel(i, r, g, b)
-        self.pixels.show()
+        self._submit(self._encode_frame([(r, g, b)] * 3))
 
     def cleanup(self):
         """Turn off LEDs."""
+        if self._thread:
+            self._submit(None)
+            self._thread.join(timeout=1.0)
+            self._thread = None
         if self.pixels:
             self.pixels.clear_strip()
 
 
 class ButtonHandler:
-    """Handles the physical button on the ReSpeaker HAT (GPIO 17)."""
+    """
+    Handles the physical button on the ReSpeaker HAT (GPIO 17).
+    Prefers libgpiod v2 edge events, read from the event loop when the
+    kernel signals them; falls back to RPi.GPIO's event detection.
+    """
 
     def __init__(self, gpio_pin=17):
         self.pin = gpio_pin
         self.callback = None
         self.enabled = False
+        self._request = None        # gpiod line request
+        self._last_press_ns = 0
 
     def init(self, on_press_callback):
-        """Setup GPIO button with callback."""
+        """Setup GPIO button with callback. Call from the event loop."""
         self.callback = on_press_callback
+        if self._init_gpiod():
+            return
         try:
             import RPi.GPIO as GPIO
             GPIO.setmode(GPIO.BCM)
             GPIO.setup(self.pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+            # RPi.GPIO calls back on its own thread; the callback chain
+            # touches asyncio state (display.dirty), so hop to the loop
+            loop = asyncio.get_running_loop()
             GPIO.add_event_detect(
                 self.pin, GPIO.FALLING,
-                callback=self._on_press,
+                callback=lambda channel: loop.call_soon_threadsafe(
+                    self._on_press, channel
+                ),
                 bouncetime=300
             )
             self.enabled = True
@@ -107,6 +256,42 @@ class ButtonHandler:
         except Exception as e:
             log.warning(f"Button init failed: {e}")
 
+    def _init_gpiod(self):
+        """Request falling-edge events via libgpiod; True on success."""
+        try:
+            import gpiod
+            from gpiod.line import Bias, Direction, Edge
+        except ImportError:
+            return False
+        try:
+            self._request = gpiod.request_lines(
+                GPIO_CHIP,
+                consumer="maya-button",
+                config={self.pin: gpiod.LineSettings(
+                    direction=Direction.INPUT,
+                    bias=Bias.PULL_UP,
+                    edge_detection=Edge.FALLING,
+                    debounce_period=timedelta(milliseconds=50),
+                )},
+            )
+            asyncio.get_running_loop().add_reader(self._request.fd, self._on_edge)
+        except Exception as e:
+            log.warning(f"gpiod button init failed, trying RPi.GPIO: {e}")
+            if self._request:
+                self._request.release()
+                self._request = None
+            return False
+        self.enabled = True
+        log.info(f"Button initialized on GPIO {self.pin} (gpiod)")
+        return True
+
+    def _on_edge(self):
+        """Read pending edge events; presses within 300ms count once."""
+        for event in self._request.read_edge_events():
+            if event.timestamp_ns - self._last_press_ns >= BUTTON_BOUNCE_NS:
+                self._last_press_ns = event.timestamp_ns
+                self._on_press(self.pin)
+
     def _on_press(self, channel):
         """Internal callback for button press."""
         if self.callback:
@@ -114,7 +299,14 @@ class ButtonHandler:
 
     def cleanup(self):
         """Release GPIO."""
-        if self.enabled:
+        if self._request:
+            try:
+                asyncio.get_running_loop().remove_reader(self._request.fd)
+            except RuntimeError:
+                pass    # loop already gone
+            self._request.release()
+            self._request = None
+        elif self.enabled:
             try:
                 import RPi.GPIO as GPIO
                 GPIO.remove_event_detect(self.pin)
@@ -122,6 +314,24 @@ class ButtonHandler:
                 pass
 
 
+async def _wait_or_kill(timeout, *procs, waiter=None):
+    """
+    Wait for subprocesses to exit, killing any still running after
+    `timeout` seconds. `waiter` overrides what is awaited (default:
+    every proc's wait()).
+    """
+    if waiter is None:
+        waiter = asyncio.gather(*(p.wait() for p in procs))
+    try:
+        await asyncio.wait_for(waiter, timeout)
+    except asyncio.TimeoutError:
+        for p in procs:
+            if p.returncode is None:
+                p.kill()
+        await asyncio.gather(*(p.wait() for p in procs))
+        log.warning(f"TTS timed out after {timeout:.1f}s — killed")
+
+
 class VoiceAssistant:
     """
     Full voice assistant using ReSpeaker 2-Mic HAT.
@@ -145,11 +355,22 @@ class VoiceAssistant:
         self.speaking = False
         self._stt_ready = False
         self._tts_ready = False
+        self._tts_path = None
         self._model = None
+        self._recognizer = None     # built once in _setup_stt()
+        self._pcm = None            # persistent ALSA playback handle
+        self._pcm_lock = asyncio.Lock()     # one utterance on the PCM at a time
+
+        # Detects the wake word and captures the command after it in one pass
+        wake_word = re.escape(self.config.get("wake_word", "hey maya"))
+        self._wake_re = re.compile(rf"\b{wake_word}\b\s*(.*)")
         self._audio_stream = None
 
         # Command handlers (extensible)
         self.command_handlers = {}
+        self._command_fns = None    # handlers by keyword index; None = rebuild
+        self._command_ac = None     # automaton or regex, see _compile_commands()
+        self._command_re = None
         self._register_default_commands()
 
         # Callbacks
@@ -183,6 +404,7 @@ class VoiceAssistant:
             "stop": self._cmd_stop,
             "quiet": self._cmd_stop,
         }
+        self._command_fns = None
 
     async def setup(self):
         """Initialize all voice subsystems."""
@@ -213,7 +435,20 @@ class VoiceAssistant:
                 log.warning("Run setup.sh to download the model")
                 return
 
-            self._model = vosk.Model(model_path)
+            # Loading the graph from the SD card takes seconds; keep the
+            # event loop (button, LEDs, display) responsive meanwhile
+            timeout = self.config.get("model_load_timeout", MODEL_LOAD_TIMEOUT)
+            try:
+                self._model = await asyncio.wait_for(
+                    asyncio.to_thread(vosk.Model, model_path), timeout
+                )
+            except asyncio.TimeoutError:
+                # The loader thread can't be interrupted; just stop waiting
+                log.error(f"Vosk model load timed out after {timeout:.0f}s")
+                return
+            sample_rate = self.audio_config.get("sample_rate", 16000)
+            self._recognizer = vosk.KaldiRecognizer(self._model, sample_rate)
+            self._recognizer.SetWords(True)
             self._stt_ready = True
             log.info(f"Vosk STT ready (model: {Path(model_path).name})")
         except ImportError:
@@ -221,21 +456,38 @@ class VoiceAssistant:
 
     def _setup_tts(self):
         """Initialize text-to-speech."""
-        import shutil
-        if shutil.which("espeak-ng"):
+        if path := cached_which("espeak-ng"):
             self._tts_ready = True
             self._tts_cmd = "espeak-ng"
+            self._tts_path = path
             log.info("TTS: espeak-ng ready")
-        elif shutil.which("espeak"):
+        elif path := cached_which("espeak"):
             self._tts_ready = True
             self._tts_cmd = "espeak"
+            self._tts_path = path
             log.info("TTS: espeak ready (fallback)")
-        elif shutil.which("piper"):
+        elif path := cached_which("piper"):
             self._tts_ready = True
             self._tts_cmd = "piper"
+            self._tts_path = path
             log.info("TTS: piper ready")
         else:
             log.warning("No TTS engine found. Install espeak-ng.")
+            return
+
+        # Opening/closing the WM8960 PCM costs hundreds of ms and can
+        # xrun, so hold one handle and stream every utterance into it
+        if alsaaudio is not None:
+            device = self.audio_config.get("playback_device", "default")
+            try:
+                self._pcm = alsaaudio.PCM(
+                    alsaaudio.PCM_PLAYBACK, device=device, rate=TTS_RATE,
+                    channels=1, format=alsaaudio.PCM_FORMAT_S16_LE,
+                    periodsize=1024,
+                )
+                log.info(f"TTS: streaming to ALSA device {device}")
+            except alsaaudio.ALSAAudioError as e:
+                log.warning(f"Could not open ALSA device {device}: {e}")
 
     def _on_button_press(self):
         """Handle hardware button press — toggle listening."""
@@ -261,27 +513,133 @@ class VoiceAssistant:
             self.on_command_result(text)
 
         try:
+            deadline = max(TTS_MIN_TIMEOUT, len(text) / 10.0)
             speed = self.config.get("tts_speed", 140)
             pitch = self.config.get("tts_pitch", 50)
             device = self.audio_config.get("playback_device", "default")
 
-            if self._tts_cmd == "piper":
-                cmd = f'echo "{text}" | piper --output-raw | aplay -D {device} -r 22050 -f S16_LE -c 1 -q'
+            if self._pcm is not None:
+                await self._speak_pcm(text, speed, pitch, deadline)
+            elif self._tts_cmd == "piper":
+                await self._speak_piper(text, device, deadline)
             else:
-                cmd = f'{self._tts_cmd} -s {speed} -p {pitch} -v en "{text}" 2>/dev/null'
-
-            proc = await asyncio.create_subprocess_shell(
-                cmd,
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            await proc.wait()
+                # Exec espeak directly: no /bin/sh, and the text is
+                # passed as one argv entry so quotes can't break it
+                proc = await asyncio.create_subprocess_exec(
+                    self._tts_path, "-s", str(speed), "-p", str(pitch),
+                    "-v", "en", text,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+                await _wait_or_kill(deadline, proc)
         except Exception as e:
             log.error(f"TTS error: {e}")
         finally:
             self.speaking = False
             self.leds.set_pattern("idle")
 
+    async def _speak_pcm(self, text, speed, pitch, deadline):
+        """
+        Run the TTS engine with raw audio on stdout and write it into the
+        persistent ALSA handle. PCM writes block until the device has
+        room, so they run in a worker thread. Utterances are serialised
+        on _pcm_lock so overlapping speak() calls can't interleave.
+        """
+        async with self._pcm_lock:
+            await self._speak_pcm_locked(text, speed, pitch, deadline)
+
+    async def _speak_pcm_locked(self, text, speed, pitch, deadline):
+        """Body of _speak_pcm(); caller holds _pcm_lock."""
+        feed = self._tts_cmd == "piper"     # piper reads its text on stdin
+        if feed:
+            args = (self._tts_path, "--output-raw")
+            skip = 0
+        else:
+            args = (self._tts_path, "-s", str(speed), "-p", str(pitch),
+                    "-v", "en", "--stdout", text)
+            skip = WAV_HEADER_LEN
+
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdin=asyncio.subprocess.PIPE if feed else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+
+        writing = None      # in-flight PCM write
+
+        async def pump():
+            nonlocal writing
+            if feed:
+                proc.stdin.write(text.encode() + b"\n")
+                await proc.stdin.drain()
+                proc.stdin.close()
+            if skip:
+                try:
+                    await proc.stdout.readexactly(skip)
+                except asyncio.IncompleteReadError:
+                    pass    # no audio; the loop below sees EOF
+            buf = b""
+            while chunk := await proc.stdout.read(4096):
+                buf += chunk
+                # ALSA takes whole frames only; carry an odd trailing byte
+                n = len(buf) & ~1
+                if n:
+                    writing = asyncio.ensure_future(
+                        asyncio.to_thread(self._pcm.write, buf[:n])
+                    )
+                    # Shielded: a timeout cancels pump(), not the write
+                    await asyncio.shield(writing)
+                    buf = buf[n:]
+            await proc.wait()
+
+        try:
+            await _wait_or_kill(deadline, proc, waiter=pump())
+        finally:
+            # Don't release the PCM while a timed-out write still holds it
+            if writing is not None:
+                await asyncio.wait([writing])
+
+    async def _speak_piper(self, text, device, deadline):
+        """
+        piper --output-raw | aplay, without a shell: the text goes in on
+        piper's stdin and its audio flows to aplay over an OS pipe, so
+        no bytes pass through Python.
+        """
+        read_fd, write_fd = os.pipe()
+        try:
+            piper = await asyncio.create_subprocess_exec(
+                self._tts_path, "--output-raw",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=write_fd,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            try:
+                aplay = await asyncio.create_subprocess_exec(
+                    cached_which("aplay") or "aplay",
+                    "-D", device, "-r", "22050", "-f", "S16_LE", "-c", "1", "-q",
+                    stdin=read_fd,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+            except BaseException:
+                # Don't leave piper blocked on a stdin nobody will close
+                piper.kill()
+                await piper.wait()
+                raise
+        finally:
+            # The children hold their own copies; aplay sees EOF once piper exits
+            os.close(read_fd)
+            os.close(write_fd)
+
+        async def feed_and_wait():
+            piper.stdin.write(text.encode() + b"\n")
+            await piper.stdin.drain()
+            piper.stdin.close()
+            await asyncio.gather(piper.wait(), aplay.wait())
+
+        await _wait_or_kill(deadline, piper, aplay, waiter=feed_and_wait())
+
     async def listen_continuous(self):
         """
         Main listening loop. Continuously monitors microphone for:
@@ -295,13 +653,10 @@ class VoiceAssistant:
                 await asyncio.sleep(1)
 
         import sounddevice as sd
-        from vosk import KaldiRecognizer
 
         sample_rate = self.audio_config.get("sample_rate", 16000)
         chunk_size = self.audio_config.get("chunk_size", 8000)
-
-        rec = KaldiRecognizer(self._model, sample_rate)
-        rec.SetWords(True)
+        rec = self._recognizer
 
         log.info("Listening for wake word or button press...")
         self.leds.set_pattern("idle")
@@ -310,6 +665,25 @@ class VoiceAssistant:
         device_name = self.audio_config.get("card_name", "seeed2micvoicec")
         device_id = self._find_audio_device(device_name)
 
+        # PortAudio delivers chunks on its own thread; they are handed to
+        # the event loop through a small queue, and Vosk decodes them in a
+        # worker thread, so capture never waits on recognition.
+        loop = asyncio.get_running_loop()
+        chunks = asyncio.Queue(maxsize=4)
+
+        def enqueue(chunk):
+            if chunks.full():
+                chunks.get_nowait()     # recognizer is behind — drop oldest
+                log.debug("Dropped an audio chunk")
+            chunks.put_nowait(chunk)
+
+        def on_audio(indata, frames, time_info, status):
+            # indata is only valid during the callback, so copy it out;
+            # Vosk's cffi binding needs bytes anyway (not a buffer/view).
+            loop.call_soon_threadsafe(
+                enqueue, (bytes(indata), status.input_overflow)
+            )
+
         try:
             with sd.RawInputStream(
                 device=device_id,
@@ -317,28 +691,30 @@ class VoiceAssistant:
                 blocksize=chunk_size,
                 dtype="int16",
                 channels=1,
-            ) as stream:
+                callback=on_audio,
+            ):
                 while True:
-                    data, overflowed = stream.read(chunk_size)
+                    data, overflowed = await chunks.get()
                     if overflowed:
                         log.debug("Audio buffer overflow")
 
-                    if rec.AcceptWaveform(bytes(data)):
-                        result = json.loads(rec.Result())
+                    if await asyncio.to_thread(rec.AcceptWaveform, data):
+                        result = _loads(rec.Result())
                         text = result.get("text", "").lower().strip()
 
                         if text:
                             await self._process_speech(text)
-                    else:
-                        # Partial results (for UI feedback)
-                        partial = json.loads(rec.PartialResult())
+                    elif self.on_speech_text:
+                        # Partial results (for UI feedback) — only worth
+                        # fetching and parsing if someone is listening
+                        partial = _loads(rec.PartialResult())
                         partial_text = partial.get("partial", "")
-                        if partial_text and self.on_speech_text:
+                        if partial_text:
                             self.on_speech_text(partial_text)
 
-                    await asyncio.sleep(0.01)  # yield to event loop
-
         except sd.PortAudioError as e:
+            global _device_cache
+            _device_cache = None    # hardware changed; rescan next time
             log.error(f"Audio device error: {e}")
             log.info("Check that ReSpeaker HAT is connected and driver installed")
         except Exception as e:
@@ -346,10 +722,12 @@ class VoiceAssistant:
 
     def _find_audio_device(self, card_name):
         """Find the sounddevice index for the ReSpeaker card."""
+        global _device_cache
         try:
             import sounddevice as sd
-            devices = sd.query_devices()
-            for i, dev in enumerate(devices):
+            if _device_cache is None:
+                _device_cache = sd.query_devices()
+            for i, dev in enumerate(_device_cache):
                 if card_name in dev.get("name", ""):
                     log.info(f"Audio device: [{i}] {dev['name']}")
                     return i
@@ -362,11 +740,8 @@ class VoiceAssistant:
         """Process recognized speech — check for wake word or direct commands."""
         log.info(f"Heard: '{text}'")
 
-        wake_word = self.config.get("wake_word", "hey maya")
-
-        if wake_word in text:
-            # Extract command after wake word
-            command = text.split(wake_word, 1)[-1].strip()
+        if m := self._wake_re.search(text):
+            command = m.group(1).strip()
             if command:
                 await self._handle_command(command)
             else:
@@ -390,11 +765,11 @@ class VoiceAssistant:
         self.leds.set_pattern("thinking")
 
         # Try to match command to handlers
-        for key, handler in self.command_handlers.items():
-            if key in command:
-                response = await handler(command)
-                await self.speak(response)
-                return
+        handler = self._match_command(command)
+        if handler:
+            response = await handler(command)
+            await self.speak(response)
+            return
 
         # Default response
         await self.speak(f"I heard you say: {command}. I'm still learning!")
@@ -402,12 +777,10 @@ class VoiceAssistant:
     # ─── Built-in Command Handlers ──────────────────────────
 
     async def _cmd_time(self, cmd):
-        now = datetime.now()
-        return f"It's {now.strftime('%I:%M %p')}"
+        return time.strftime("It's %I:%M %p")
 
     async def _cmd_date(self, cmd):
-        now = datetime.now()
-        return f"Today is {now.strftime('%A, %B %d')}"
+        return time.strftime("Today is %A, %B %d")
 
     async def _cmd_hello(self, cmd):
         return "Hello! How are you feeling today?"
@@ -423,13 +796,7 @@ class VoiceAssistant:
         return "You're welcome! That's what I'm here for."
 
     async def _cmd_greeting(self, cmd):
-        hour = datetime.now().hour
-        if hour < 12:
-            return "Good morning! Did you sleep well?"
-        elif hour < 17:
-            return "Good afternoon! Having a nice day?"
-        else:
-            return "Good evening! How was your day?"
+        return GREETINGS[time.localtime().tm_hour]
 
     async def _cmd_goodnight(self, cmd):
         return "Good night! Sleep well. I'll keep watch."
@@ -450,6 +817,40 @@ class VoiceAssistant:
         self.listening = False
         return "Okay, going quiet."
 
+    def _compile_commands(self):
+        """
+        Precompile all keywords for _match_command(). With pyahocorasick
+        this is one automaton scanning the text once; otherwise one regex
+        where each keyword is a lookahead alternative, tried in
+        registration order.
+        """
+        keys = list(self.command_handlers)
+        self._command_fns = tuple(self.command_handlers[k] for k in keys)
+        if ahocorasick and keys:
+            self._command_ac = ahocorasick.Automaton()
+            for i, k in enumerate(keys):
+                self._command_ac.add_word(k, i)
+            self._command_ac.make_automaton()
+        else:
+            self._command_ac = None
+            pattern = "|".join(f"(?=.*?({re.escape(k)}))" for k in keys)
+            self._command_re = re.compile(pattern or "(?!)", re.DOTALL)
+
+    def _match_command(self, command):
+        """
+        Handler for the command, or None. Same result as checking
+        `key in command` for each key in turn: the first registered
+        keyword found anywhere in the text wins.
+        """
+        if self._command_fns is None:
+            self._compile_commands()
+        if self._command_ac is not None:
+            i = min((i for _, i in self._command_ac.iter(command)), default=None)
+        else:
+            m = self._command_re.match(command)
+            i = m.lastindex - 1 if m else None
+        return None if i is None else self._command_fns[i]
+
     def register_command(self, keywords, handler):
         """Register a custom command handler.
         keywords: str or list of str trigger words
@@ -459,9 +860,13 @@ class VoiceAssistant:
             keywords = [keywords]
         for kw in keywords:
             self.command_handlers[kw.lower()] = handler
+        self._command_fns = None
 
     def cleanup(self):
         """Release resources."""
         self.leds.cleanup()
         self.button.cleanup()
+        if self._pcm is not None:
+            self._pcm.close()
+            self._pcm = None
         log.info("Voice assistant shut down")